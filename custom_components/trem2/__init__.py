@@ -25,6 +25,7 @@ from .const import (
     PROVIDER_OPTIONS,
     STARTUP,
 )
+from .core.sitegrid import site_grid
 from .runtime import Trem2RuntimeData
 from .services import async_register_services
 from .store import StoreHandler
@@ -104,6 +105,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: Trem2ConfigEntry)
     )
     store_handler = StoreHandler(hass, config_entry)
     store_handler.setup_stores()
+    await store_handler.async_load_stores()
     config_entry.runtime_data = Trem2RuntimeData(
         coordinator=update_coordinator,
         sotre_handler=store_handler,
@@ -114,16 +116,19 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: Trem2ConfigEntry)
         update_interval=update_interval,
     )
 
+    # Setup coordinator data from the stores loaded above
+    update_coordinator.data = {}
+    await update_coordinator.data_client.load_recent_data()
+    await update_coordinator.data_client.load_report_data()
+
+    # Map the site amplification grid off the event loop, the estimates fall back to county factors without it
+    await hass.async_add_executor_job(site_grid)
+
     # Set up the platforms
     await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
 
     # Refresh data for coordinator when a config entry is setup
     await update_coordinator.async_config_entry_first_refresh()
-
-    # Setup coordinator data
-    update_coordinator.data = {}
-    await update_coordinator.data_client.load_recent_data()
-    await update_coordinator.data_client.load_report_data()
     await update_coordinator.data_client.fetch_report()
 
     # Install fonts if not already installed
@@ -228,18 +233,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: Trem2ConfigEntry
     """Unload a config entry."""
     domain_data: dict = hass.data[DOMAIN]
     runtime_data = config_entry.runtime_data
-    coordinator = runtime_data.coordinator
-
-    # Stored coordinator data
-    recent_data = coordinator.data["recent"]
-    recent_store = runtime_data.sotre_handler.get_store("recent")
-    if recent_data and recent_store:
-        await recent_store.async_save(recent_data)
-
-    report_data = coordinator.data["report"]
-    report_store = runtime_data.sotre_handler.get_store("report")
-    if report_data and report_store:
-        await report_store.async_save(report_data)
+
+    # Write the coordinator data which has not been saved yet
+    await runtime_data.sotre_handler.async_flush()
 
     # Unload platforms
     unload_ok = all(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import json
 
 from aiohttp import ClientSession
@@ -29,20 +30,43 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 from .const import (
     CLIENT_NAME,
     CONF_AGREE,
+    CONF_EEW_HISTORY,
+    CONF_GROUND_MOTION_MODEL,
+    CONF_IMAGE_EFFORT,
+    CONF_IMAGE_FORMAT,
+    CONF_IMAGE_SIZES,
+    CONF_ISOSEISMAL_FIELD,
     CONF_PASS,
     CONF_PROVIDER,
+    CONF_RENDERER,
+    CONF_REPORT_HISTORY,
+    CONF_SAVE_DELAY,
+    CONF_SITES,
+    DEFAULT_EEW_HISTORY,
+    DEFAULT_GROUND_MOTION_MODEL,
+    DEFAULT_IMAGE_EFFORT,
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_IMAGE_SIZES,
+    DEFAULT_RENDERER,
+    DEFAULT_REPORT_HISTORY,
+    DEFAULT_SAVE_DELAY,
     DOMAIN,
     HA_USER_AGENT,
+    IMAGE_FORMAT_OPTIONS,
     LOGIN_URL,
+    MAX_HISTORY,
     PROVIDER_OPTIONS,
+    RENDERER_OPTIONS,
     REQUEST_TIMEOUT,
     SOURCE_INIT,
     __version__ as CLIENT_VER,
 )
+from .core.gmm import GROUND_MOTION_MODELS
 
 
 @HANDLERS.register(DOMAIN)
@@ -175,6 +199,7 @@ class OptionsFlowHandler(OptionsFlow):
                     vol.Optional(CONF_EMAIL): str,
                     vol.Optional(CONF_PASSWORD): str,
                     vol.Required(CONF_PROVIDER): vol.In([x[0] for x in PROVIDER_OPTIONS]),
+                    **_options_schema(self.config_entry.options),
                     vol.Required(CONF_AGREE): bool,
                 }),
                 self.config_entry.options,
@@ -251,12 +276,59 @@ class OptionsFlowHandler(OptionsFlow):
                 vol.Required(CONF_PROVIDER, default=user_input.get(CONF_PROVIDER, "")): vol.In([
                     x[0] for x in PROVIDER_OPTIONS
                 ]),
+                **_options_schema(user_input),
                 vol.Required(CONF_AGREE): bool,
             }),
             errors={"base": result.get("error", "unknown")},
         )
 
 
+def _options_schema(options: Mapping) -> dict:
+    """Return the schema of the options which are not related to the account."""
+    return {
+        vol.Optional(
+            CONF_GROUND_MOTION_MODEL,
+            default=options.get(CONF_GROUND_MOTION_MODEL, DEFAULT_GROUND_MOTION_MODEL),
+        ): vol.In(list(GROUND_MOTION_MODELS)),
+        vol.Optional(
+            CONF_RENDERER,
+            default=options.get(CONF_RENDERER, DEFAULT_RENDERER),
+        ): vol.In(RENDERER_OPTIONS),
+        vol.Optional(
+            CONF_ISOSEISMAL_FIELD,
+            default=options.get(CONF_ISOSEISMAL_FIELD, False),
+        ): bool,
+        vol.Optional(
+            CONF_IMAGE_FORMAT,
+            default=options.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT),
+        ): vol.In(IMAGE_FORMAT_OPTIONS),
+        vol.Optional(
+            CONF_IMAGE_EFFORT,
+            default=options.get(CONF_IMAGE_EFFORT, DEFAULT_IMAGE_EFFORT),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=9)),
+        vol.Optional(
+            CONF_IMAGE_SIZES,
+            default=options.get(CONF_IMAGE_SIZES, DEFAULT_IMAGE_SIZES),
+        ): vol.Match(r"^[\d\s,]*$"),
+        vol.Optional(
+            CONF_SITES,
+            default=options.get(CONF_SITES, ""),
+        ): TextSelector(TextSelectorConfig(multiline=True)),
+        vol.Optional(
+            CONF_SAVE_DELAY,
+            default=options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+        vol.Optional(
+            CONF_EEW_HISTORY,
+            default=options.get(CONF_EEW_HISTORY, DEFAULT_EEW_HISTORY),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_HISTORY)),
+        vol.Optional(
+            CONF_REPORT_HISTORY,
+            default=options.get(CONF_REPORT_HISTORY, DEFAULT_REPORT_HISTORY),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_HISTORY)),
+    }
+
+
 async def _verify(session: ClientSession, user_input: dict) -> dict:
     result = {
         "success": False,
@@ -11,6 +11,7 @@ from .models import StoreDefinition
 
 # Initialize
 BUTTON_ICON = "mdi:file-document-refresh"
+COUNTDOWN_ICON = "mdi:timer-sand"
 DEFAULT_ICON = "mdi:waveform"
 REPORT_ICON = "mdi:file-document"
 DOMAIN = "trem2"
@@ -28,8 +29,18 @@ EXTRA_PLATFORMS = [
 
 # Config
 CONF_AGREE = "agree_tos_20250523"
+CONF_EEW_HISTORY = "eew_history"
+CONF_GROUND_MOTION_MODEL = "ground_motion_model"
+CONF_IMAGE_EFFORT = "image_effort"
+CONF_IMAGE_FORMAT = "image_format"
+CONF_IMAGE_SIZES = "image_sizes"
+CONF_ISOSEISMAL_FIELD = "isoseismal_field"
 CONF_PASS = "pass"
 CONF_PROVIDER = "type"
+CONF_REPORT_HISTORY = "report_history"
+CONF_RENDERER = "renderer"
+CONF_SAVE_DELAY = "save_delay"
+CONF_SITES = "sites"
 PROVIDER_OPTIONS = [
     ("全部 (ALL)", ""),
     ("中央氣象署 (CWA)", "cwa"),
@@ -43,6 +54,17 @@ PARAMS_OPTIONS = [
     CONF_PROVIDER,
 ]
 SOURCE_INIT = "init"
+DEFAULT_EEW_HISTORY = 10
+DEFAULT_GROUND_MOTION_MODEL = "trem"
+DEFAULT_IMAGE_EFFORT = 4
+DEFAULT_IMAGE_FORMAT = "png"
+DEFAULT_IMAGE_SIZES = ""
+DEFAULT_RENDERER = "layered"
+DEFAULT_REPORT_HISTORY = 5
+DEFAULT_SAVE_DELAY = 10
+IMAGE_FORMAT_OPTIONS = ["png", "png8", "webp", "jpeg"]
+RENDERER_OPTIONS = ["layered", "mask"]
+MAX_HISTORY = 1000
 
 # Proj
 CLIENT_NAME = "HA-TREM2"
@@ -65,6 +87,12 @@ ATTR_AUTHOR = "provider"
 ATTR_DEPTH = "depth"
 ATTR_MAG = "magnitude"
 ATTR_LIST = "list"
+ATTR_ESTIMATED_LIST = "estimated_list"
+ATTR_INTENSITY = "intensity"
+ATTR_SITE_EFFECT = "site_effect"
+ATTR_COUNTY_ARRIVAL = "county_s_arrival"
+ATTR_P_ARRIVAL = "p_arrival"
+ATTR_S_ARRIVAL = "s_arrival"
 ATTR_TIME = "time_of_occurrence"
 ATTR_COUNTY = {
     "TWCHA": "彰化縣",
@@ -492,11 +520,23 @@ NOTIFICATION_ATTR = [
     ATTR_MAG,
     ATTR_LOCATION,
     ATTR_LIST,
+    ATTR_ESTIMATED_LIST,
     ATTR_TIME,
 ]
 MANUFACTURER = "高家田 (jayx1011)"
 
+# Service
+ATTR_EVENTS = "events"
+ATTR_LEVEL = "level"
+ESTIMATE_LEVELS = ["county", "town"]
+
+# Image
+ATTR_DROPPED_FRAMES = "dropped_frames"
+ATTR_RENDER_QUEUE = "render_queue_depth"
+IMAGE_CACHE_BYTES = 8 * 1024 * 1024
+
 # Stored
+DEDUP_INDEX_SIZE = MAX_HISTORY
 STORAGE_EEW_KEY = "{domain}/{entry_id}/recent_data.json"
 STORAGE_REPORT_KEY = "{domain}/{entry_id}/report.json"
 DEFINED_STORES: dict[str, StoreDefinition] = {
@@ -535,6 +575,8 @@ REQUEST_TIMEOUT = ClientTimeout(
 FAST_INTERVAL = timedelta(seconds=1)
 BASE_INTERVAL = timedelta(seconds=5)
 MAX_INTERVAL = timedelta(minutes=15)
+COUNTDOWN_INTERVAL = timedelta(seconds=1)
+ARRIVAL_WINDOW = timedelta(minutes=5)
 
 # STRINGS
 STARTUP = f"""
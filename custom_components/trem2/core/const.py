@@ -71,6 +71,420 @@ COUNTY_CENTERS = {
     "TWCYI": (23.48, 120.45),
 }
 
+# Approximate location of each township office by ZIP3 code, grouped by county
+TOWN_CENTERS = {
+    "TWTPE": {
+        100: (25.03, 121.52),
+        103: (25.06, 121.51),
+        104: (25.06, 121.53),
+        105: (25.05, 121.56),
+        106: (25.03, 121.54),
+        108: (25.04, 121.50),
+        110: (25.03, 121.57),
+        111: (25.09, 121.53),
+        112: (25.13, 121.50),
+        114: (25.07, 121.59),
+        115: (25.06, 121.61),
+        116: (24.99, 121.57),
+    },
+    "TWKEE": {
+        200: (25.13, 121.74),
+        201: (25.13, 121.76),
+        202: (25.14, 121.78),
+        203: (25.15, 121.73),
+        204: (25.12, 121.72),
+        205: (25.10, 121.74),
+        206: (25.10, 121.71),
+    },
+    "TWNWT": {
+        207: (25.18, 121.69),
+        208: (25.22, 121.64),
+        220: (25.01, 121.46),
+        221: (25.06, 121.66),
+        222: (25.00, 121.62),
+        223: (24.99, 121.66),
+        224: (25.11, 121.81),
+        226: (25.03, 121.74),
+        227: (25.03, 121.87),
+        228: (25.02, 121.91),
+        231: (24.97, 121.54),
+        232: (24.94, 121.71),
+        233: (24.87, 121.55),
+        234: (25.01, 121.52),
+        235: (25.00, 121.50),
+        236: (24.97, 121.44),
+        237: (24.93, 121.37),
+        238: (24.99, 121.42),
+        239: (24.96, 121.36),
+        241: (25.06, 121.49),
+        242: (25.04, 121.45),
+        243: (25.06, 121.43),
+        244: (25.08, 121.39),
+        247: (25.09, 121.47),
+        248: (25.08, 121.44),
+        249: (25.15, 121.40),
+        251: (25.17, 121.44),
+        252: (25.26, 121.50),
+        253: (25.29, 121.57),
+    },
+    "TWLIE": {
+        209: (26.16, 119.95),
+        210: (26.22, 120.00),
+        211: (25.97, 119.94),
+        212: (26.37, 120.49),
+    },
+    "TWILA": {
+        260: (24.76, 121.75),
+        261: (24.86, 121.82),
+        262: (24.83, 121.77),
+        263: (24.75, 121.78),
+        264: (24.75, 121.72),
+        265: (24.68, 121.77),
+        266: (24.67, 121.65),
+        267: (24.68, 121.61),
+        268: (24.69, 121.80),
+        269: (24.64, 121.79),
+        270: (24.60, 121.85),
+        272: (24.47, 121.80),
+        290: (25.74, 123.47),
+    },
+    "TWHSZ": {
+        300: (24.80, 120.97),
+    },
+    "TWHSQ": {
+        302: (24.84, 121.00),
+        303: (24.90, 121.04),
+        304: (24.90, 120.98),
+        305: (24.83, 121.07),
+        306: (24.79, 121.18),
+        307: (24.78, 121.08),
+        308: (24.76, 120.99),
+        310: (24.74, 121.09),
+        311: (24.64, 121.12),
+        312: (24.72, 121.12),
+        313: (24.70, 121.20),
+        314: (24.70, 121.06),
+        315: (24.69, 121.02),
+    },
+    "TWTAO": {
+        320: (24.97, 121.23),
+        324: (24.95, 121.22),
+        325: (24.86, 121.22),
+        326: (24.91, 121.15),
+        327: (24.97, 121.11),
+        328: (25.03, 121.08),
+        330: (24.99, 121.30),
+        333: (24.99, 121.34),
+        334: (24.93, 121.29),
+        335: (24.88, 121.29),
+        336: (24.82, 121.35),
+        337: (25.06, 121.20),
+        338: (25.05, 121.29),
+    },
+    "TWMIA": {
+        350: (24.69, 120.87),
+        351: (24.69, 120.91),
+        352: (24.65, 120.95),
+        353: (24.60, 121.00),
+        354: (24.54, 120.92),
+        356: (24.62, 120.79),
+        357: (24.49, 120.68),
+        358: (24.44, 120.65),
+        360: (24.56, 120.82),
+        361: (24.64, 120.86),
+        362: (24.57, 120.85),
+        363: (24.50, 120.82),
+        364: (24.42, 120.86),
+        365: (24.47, 120.91),
+        366: (24.49, 120.79),
+        367: (24.41, 120.77),
+        368: (24.56, 120.75),
+        369: (24.31, 120.82),
+    },
+    "TWTXG": {
+        400: (24.14, 120.68),
+        401: (24.14, 120.70),
+        402: (24.12, 120.66),
+        403: (24.14, 120.66),
+        404: (24.16, 120.68),
+        406: (24.18, 120.69),
+        407: (24.18, 120.63),
+        408: (24.14, 120.64),
+        411: (24.13, 120.72),
+        412: (24.10, 120.68),
+        413: (24.06, 120.70),
+        414: (24.11, 120.62),
+        420: (24.25, 120.72),
+        421: (24.31, 120.71),
+        422: (24.28, 120.78),
+        423: (24.26, 120.83),
+        424: (24.18, 120.88),
+        426: (24.23, 120.81),
+        427: (24.21, 120.71),
+        428: (24.23, 120.65),
+        429: (24.26, 120.66),
+        432: (24.15, 120.54),
+        433: (24.23, 120.57),
+        434: (24.19, 120.55),
+        435: (24.26, 120.53),
+        436: (24.27, 120.56),
+        437: (24.35, 120.62),
+        438: (24.33, 120.65),
+        439: (24.35, 120.59),
+    },
+    "TWCHA": {
+        500: (24.08, 120.54),
+        502: (24.01, 120.63),
+        503: (24.03, 120.54),
+        504: (24.04, 120.50),
+        505: (24.06, 120.43),
+        506: (24.05, 120.44),
+        507: (24.13, 120.47),
+        508: (24.11, 120.50),
+        509: (24.15, 120.48),
+        510: (23.96, 120.58),
+        511: (23.90, 120.58),
+        512: (23.93, 120.55),
+        513: (23.95, 120.54),
+        514: (23.96, 120.48),
+        515: (23.99, 120.54),
+        516: (24.00, 120.46),
+        520: (23.86, 120.58),
+        521: (23.87, 120.52),
+        522: (23.89, 120.53),
+        523: (23.89, 120.46),
+        524: (23.85, 120.49),
+        525: (23.86, 120.43),
+        526: (23.90, 120.37),
+        527: (23.85, 120.32),
+        528: (23.92, 120.32),
+        530: (23.81, 120.62),
+    },
+    "TWNAN": {
+        540: (23.92, 120.68),
+        541: (23.88, 120.77),
+        542: (23.97, 120.68),
+        544: (23.98, 120.86),
+        545: (23.97, 120.97),
+        546: (24.02, 121.13),
+        551: (23.84, 120.68),
+        552: (23.83, 120.78),
+        553: (23.81, 120.85),
+        555: (23.90, 120.94),
+        556: (23.70, 120.86),
+        557: (23.76, 120.67),
+        558: (23.75, 120.75),
+    },
+    "TWCYI": {
+        600: (23.48, 120.45),
+    },
+    "TWCYQ": {
+        602: (23.47, 120.56),
+        603: (23.58, 120.56),
+        604: (23.52, 120.55),
+        605: (23.46, 120.73),
+        606: (23.43, 120.52),
+        607: (23.30, 120.59),
+        608: (23.43, 120.40),
+        611: (23.41, 120.31),
+        612: (23.46, 120.33),
+        613: (23.47, 120.25),
+        614: (23.46, 120.15),
+        615: (23.49, 120.29),
+        616: (23.55, 120.35),
+        621: (23.55, 120.43),
+        622: (23.60, 120.47),
+        623: (23.60, 120.39),
+        624: (23.34, 120.24),
+        625: (23.38, 120.17),
+    },
+    "TWYUN": {
+        630: (23.68, 120.48),
+        631: (23.65, 120.43),
+        632: (23.71, 120.43),
+        633: (23.68, 120.39),
+        634: (23.70, 120.31),
+        635: (23.70, 120.25),
+        636: (23.70, 120.20),
+        637: (23.76, 120.35),
+        638: (23.75, 120.25),
+        640: (23.71, 120.54),
+        643: (23.76, 120.62),
+        646: (23.65, 120.56),
+        647: (23.76, 120.50),
+        648: (23.80, 120.47),
+        649: (23.77, 120.42),
+        651: (23.58, 120.30),
+        652: (23.57, 120.25),
+        653: (23.58, 120.19),
+        654: (23.64, 120.23),
+        655: (23.65, 120.31),
+    },
+    "TWTNN": {
+        700: (22.99, 120.20),
+        701: (22.98, 120.22),
+        702: (22.96, 120.19),
+        704: (23.01, 120.21),
+        708: (23.00, 120.17),
+        709: (23.05, 120.19),
+        710: (23.03, 120.26),
+        711: (22.97, 120.29),
+        712: (23.04, 120.31),
+        713: (23.06, 120.41),
+        714: (23.12, 120.46),
+        715: (23.17, 120.49),
+        716: (23.04, 120.48),
+        717: (22.97, 120.25),
+        718: (22.96, 120.33),
+        719: (22.97, 120.36),
+        720: (23.19, 120.31),
+        721: (23.18, 120.25),
+        722: (23.17, 120.18),
+        723: (23.12, 120.20),
+        724: (23.14, 120.14),
+        725: (23.20, 120.16),
+        726: (23.23, 120.18),
+        727: (23.27, 120.13),
+        730: (23.31, 120.32),
+        731: (23.37, 120.36),
+        732: (23.35, 120.42),
+        733: (23.33, 120.40),
+        734: (23.23, 120.35),
+        735: (23.24, 120.26),
+        736: (23.28, 120.31),
+        737: (23.32, 120.27),
+        741: (23.13, 120.30),
+        742: (23.12, 120.35),
+        743: (23.10, 120.35),
+        744: (23.08, 120.30),
+        745: (23.12, 120.24),
+    },
+    "TWKHH": {
+        800: (22.63, 120.31),
+        801: (22.63, 120.29),
+        802: (22.62, 120.31),
+        803: (22.62, 120.29),
+        804: (22.64, 120.28),
+        805: (22.59, 120.29),
+        806: (22.60, 120.32),
+        807: (22.65, 120.30),
+        811: (22.73, 120.33),
+        812: (22.57, 120.34),
+        813: (22.69, 120.30),
+        814: (22.70, 120.35),
+        815: (22.73, 120.35),
+        820: (22.80, 120.30),
+        821: (22.86, 120.26),
+        822: (22.88, 120.33),
+        823: (22.87, 120.36),
+        824: (22.79, 120.36),
+        825: (22.76, 120.31),
+        826: (22.76, 120.27),
+        827: (22.78, 120.25),
+        828: (22.82, 120.23),
+        829: (22.91, 120.21),
+        830: (22.63, 120.36),
+        831: (22.61, 120.40),
+        832: (22.51, 120.39),
+        833: (22.66, 120.36),
+        840: (22.69, 120.43),
+        842: (22.89, 120.48),
+        843: (22.90, 120.54),
+        844: (23.00, 120.63),
+        845: (22.94, 120.46),
+        846: (22.97, 120.54),
+        847: (23.08, 120.59),
+        848: (23.16, 120.76),
+        849: (23.25, 120.70),
+        851: (22.89, 120.66),
+        852: (22.91, 120.18),
+    },
+    "TWPEN": {
+        880: (23.57, 119.58),
+        881: (23.60, 119.51),
+        882: (23.36, 119.50),
+        883: (23.21, 119.43),
+        884: (23.67, 119.60),
+        885: (23.58, 119.66),
+    },
+    "TWKIN": {
+        890: (24.49, 118.42),
+        891: (24.44, 118.42),
+        892: (24.46, 118.33),
+        893: (24.43, 118.32),
+        894: (24.43, 118.25),
+        896: (24.99, 119.45),
+    },
+    "TWPIF": {
+        900: (22.67, 120.49),
+        901: (22.71, 120.65),
+        902: (22.75, 120.73),
+        903: (22.71, 120.64),
+        904: (22.74, 120.49),
+        905: (22.78, 120.49),
+        906: (22.83, 120.60),
+        907: (22.75, 120.57),
+        908: (22.68, 120.53),
+        909: (22.65, 120.53),
+        911: (22.59, 120.54),
+        912: (22.61, 120.57),
+        913: (22.59, 120.49),
+        920: (22.55, 120.54),
+        921: (22.60, 120.63),
+        922: (22.53, 120.63),
+        923: (22.57, 120.57),
+        924: (22.51, 120.52),
+        925: (22.47, 120.55),
+        926: (22.49, 120.51),
+        927: (22.43, 120.52),
+        928: (22.47, 120.45),
+        929: (22.34, 120.37),
+        931: (22.42, 120.55),
+        932: (22.54, 120.46),
+        940: (22.37, 120.59),
+        941: (22.26, 120.66),
+        942: (22.37, 120.63),
+        943: (22.20, 120.71),
+        944: (22.07, 120.71),
+        945: (22.13, 120.77),
+        946: (22.00, 120.74),
+        947: (22.02, 120.84),
+    },
+    "TWTTT": {
+        950: (22.76, 121.14),
+        951: (22.66, 121.49),
+        952: (22.05, 121.55),
+        953: (22.90, 121.08),
+        954: (22.79, 121.08),
+        955: (22.91, 121.14),
+        956: (23.05, 121.16),
+        957: (23.10, 121.17),
+        958: (23.13, 121.22),
+        959: (22.97, 121.30),
+        961: (23.10, 121.38),
+        962: (23.32, 121.45),
+        963: (22.62, 121.01),
+        964: (22.59, 120.97),
+        965: (22.34, 120.89),
+        966: (22.30, 120.88),
+    },
+    "TWHUA": {
+        970: (23.99, 121.60),
+        971: (24.04, 121.60),
+        972: (24.12, 121.62),
+        973: (23.97, 121.57),
+        974: (23.87, 121.51),
+        975: (23.74, 121.45),
+        976: (23.67, 121.42),
+        977: (23.60, 121.52),
+        978: (23.50, 121.38),
+        979: (23.72, 121.42),
+        981: (23.34, 121.31),
+        982: (23.35, 121.30),
+        983: (23.18, 121.25),
+    },
+}
+
 COUNTY_NAME = {
     "TWCHA": "彰化縣",
     "TWCYI": "嘉義市",
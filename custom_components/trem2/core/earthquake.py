@@ -1,38 +1,17 @@
 """Calculate Earthquake for Taiwan Real-time Earthquake Monitoring integration."""
 
-import math
-from math import atan2, ceil, cos, radians, sin, sqrt
+from functools import lru_cache
+from math import ceil
 
-from .const import COUNTY_CENTERS, COUNTY_SITE_VALUES, EARTH_RADIUS, TAIWAN_CENTER
+import numpy as np
 
+from .const import TAIWAN_CENTER
+from .geo import COUNTY_TABLE, DEFAULT_SITE_EFFECT, TOWN_TABLE, GeoTable
+from .gmm import DEFAULT_MODEL, GroundMotionModel, get_model
 
-def calculate_distance(lat1, lon1, lat2, lon2) -> float:
-    """Calculate the distance between two points using the Haversine formula."""
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-
-    return 2 * atan2(sqrt(a), sqrt(1 - a))
-
-
-def calculate_intensity(magnitude: float, hypocenter_distance: float, depth: int, site_effect: float = 1.751) -> float:
-    """Calculate the intensity of an earthquake."""
-    pga = 1.657 * math.exp(1.533 * magnitude) * hypocenter_distance**-1.607 * (site_effect or 1.751)
-    i = 2 * math.log10(pga) + 0.7
-
-    if i > 3:
-        long = 10 ** (0.5 * magnitude - 1.85) / 2
-        x = max(hypocenter_distance - long, 3)
-        gpv600 = 10 ** (
-            0.58 * magnitude + 0.0038 * depth - 1.29 - math.log10(x + 0.0028 * 10 ** (0.5 * magnitude)) - 0.002 * x
-        )
-        arv = 1.0
-        pgv400 = gpv600 * 1.31
-        pgv = pgv400 * arv
-        i = 2.68 + 1.72 * math.log10(pgv)
-
-    return i
+BATCH_CHUNK = 1024
+ESTIMATE_CACHE_SIZE = 32
+ROUND_THRESHOLDS = np.array([4.5, 5, 5.5, 6, 6.5])
 
 
 def round_intensity(intensity: float) -> int:
@@ -74,24 +53,134 @@ def intensity_to_text(intensity) -> str:
             return "7級"
 
 
-def get_calculate_intensity(eq_data: dict) -> dict:
-    """Calculate the intensity of an earthquake based on its data."""
+def estimate_intensity(
+    magnitude,
+    hypocenter_distance,
+    depth,
+    site_effect=DEFAULT_SITE_EFFECT,
+    model: str = DEFAULT_MODEL,
+) -> np.ndarray:
+    """Evaluate a ground motion model, the inputs are arrays which broadcast together."""
+    return get_model(model)(magnitude, hypocenter_distance, depth, site_effect)
+
+
+def round_intensitys(intensity) -> np.ndarray:
+    """Vectorized `round_intensity`."""
+    intensity = np.asarray(intensity, dtype=np.float64)
+    scale = np.where(
+        intensity < 4.5,
+        np.ceil(np.maximum(intensity, 0)),
+        4 + np.searchsorted(ROUND_THRESHOLDS, intensity, side="right"),
+    )
+
+    return scale.astype(np.int8)
+
+
+def calculate_intensitys(
+    lat,
+    lon,
+    depth,
+    mag,
+    table: GeoTable = COUNTY_TABLE,
+    model: str = DEFAULT_MODEL,
+) -> np.ndarray:
+    """Calculate the intensity at every point of the table in one pass.
+
+    The epicenter is given in degrees. A single event returns one value per
+    point, arrays of events return one row per event. The model is looked
+    up once, so it adds no work per point.
+    """
+    depth = np.asarray(depth, dtype=np.float64)[..., np.newaxis]
+    mag = np.asarray(mag, dtype=np.float64)[..., np.newaxis]
+
+    distance = table.distances(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64))
+    hypocenter_distance = np.sqrt(distance**2 + depth**2)
+
+    return estimate_intensity(mag, hypocenter_distance, depth, table.site_effect, model)
+
+
+def quantize_event(eq_data: dict) -> tuple[float, float, float, float]:
+    """Return the epicenter, depth and magnitude rounded to 0.01°, 0.1 km and 0.1 M."""
+    return (
+        round(float(eq_data.get("lat") or TAIWAN_CENTER[0]), 2),
+        round(float(eq_data.get("lon") or TAIWAN_CENTER[1]), 2),
+        round(float(eq_data.get("depth") or 0), 1),
+        round(float(eq_data.get("mag") or 0), 1),
+    )
+
+
+def estimate_event(eq_data: dict, table: GeoTable = COUNTY_TABLE, model: str = DEFAULT_MODEL) -> np.ndarray:
+    """Return the intensity of an earthquake at every point of the table.
+
+    The estimate is computed from the quantized parameters and kept in a
+    bounded cache shared by every consumer, so repeated serials and
+    listener callbacks of the same event cost one computation. The
+    returned array is read-only.
+    """
+    return _estimate_event(*quantize_event(eq_data), table, get_model(model))
+
+
+@lru_cache(maxsize=ESTIMATE_CACHE_SIZE)
+def _estimate_event(lat, lon, depth, mag, table: GeoTable, model: GroundMotionModel) -> np.ndarray:
+    """Compute the intensity of an earthquake, the model and its version are part of the cache key."""
+    intensity = calculate_intensitys(lat, lon, depth, mag, table, model.name)
+    intensity.setflags(write=False)
+
+    return intensity
+
+
+def estimate_cache_info():
+    """Return the hits, misses and size of the estimate cache."""
+    return _estimate_event.cache_info()
+
+
+def get_calculate_intensity(eq_data: dict | list[dict], model: str = DEFAULT_MODEL) -> dict | list[dict]:
+    """Calculate the intensity of an earthquake based on its data, a list of earthquakes is calculated at once."""
     if eq_data is None:
         return None
 
-    depth = eq_data.get("depth", 0)
-    lat = eq_data.get("lat", TAIWAN_CENTER[0])
-    lon = eq_data.get("lon", TAIWAN_CENTER[1])
-    mag = eq_data.get("mag", 0)
+    if not isinstance(eq_data, list):
+        return dict(zip(COUNTY_TABLE.keys, estimate_event(eq_data, model=model).tolist(), strict=True))
+
+    intensitys = calculate_intensitys(*_event_arrays(eq_data), model=model)
+
+    return [dict(zip(COUNTY_TABLE.keys, row, strict=True)) for row in intensitys.tolist()]
+
+
+def _event_arrays(events: list[dict]) -> np.ndarray:
+    """Return the quantized latitude, longitude, depth and magnitude of the events as four rows."""
+    return np.array([quantize_event(eq) for eq in events], dtype=np.float64).reshape(-1, 4).T
+
+
+def estimate_batch(events: list[dict], table: GeoTable = COUNTY_TABLE, model: str = DEFAULT_MODEL) -> list[dict]:
+    """Estimate the intensity scale of many events at every point of the table.
+
+    The events are computed `BATCH_CHUNK` at a time as one array, which
+    bounds the memory of large catalogues. Each result maps the keys of
+    the table to the scale, points below scale 1 are left out.
+    """
+    results = []
+    for start in range(0, len(events), BATCH_CHUNK):
+        chunk = _event_arrays(events[start:start + BATCH_CHUNK])
+        scales = round_intensitys(calculate_intensitys(*chunk, table, model))
+        results.extend(
+            {key: scale for key, scale in zip(table.keys, row, strict=True) if scale > 0} for row in scales.tolist()
+        )
+
+    return results
+
 
-    intensity_map = {}
-    squared_depth = depth**2
+def estimate_town_intensity(eq_data: dict, model: str = DEFAULT_MODEL) -> dict[str, list[int]]:
+    """Estimate the intensity of every township in one pass.
 
-    for county_id, (county_lat, county_lon) in COUNTY_CENTERS.items():
-        site_effect = COUNTY_SITE_VALUES.get(county_id, 1.751)
-        distance_in_radians = calculate_distance(lat, lon, county_lat, county_lon)
-        real_distance = sqrt((distance_in_radians * EARTH_RADIUS) ** 2 + squared_depth)
+    The result has the same format as the `area` of the intensity data,
+    the ZIP3 codes grouped by intensity scale. Townships below scale 1
+    are left out.
+    """
+    if not eq_data:
+        return {}
 
-        intensity_map[county_id] = calculate_intensity(mag, real_distance, depth, site_effect)
+    scales = round_intensitys(estimate_event(eq_data, TOWN_TABLE, model))
+    zip3 = np.asarray(TOWN_TABLE.keys)
 
-    return intensity_map
+    return {str(scale): zip3[scales == scale].tolist() for scale in np.unique(scales[scales > 0]).tolist()}
@@ -0,0 +1,46 @@
+"""Gridded isoseismal field for Taiwan Real-time Earthquake Monitoring integration."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from .earthquake import estimate_event, round_intensitys
+from .geo import TOWN_TABLE, GeoTable, unit_vectors
+from .gmm import DEFAULT_MODEL
+from .map import svg_to_latlon
+
+FIELD_CELL = 5
+FIELD_SIZE = 200
+NEAREST_CHUNK = 4096
+
+
+@lru_cache(maxsize=1)
+def grid_table() -> GeoTable:
+    """Return the cell centers of the map grid, row by row from the top left.
+
+    The grid covers the 1000 px map with `FIELD_SIZE` cells per side. Each
+    cell samples the site amplification grid, else it takes the site
+    effect of the nearest township, this is only done on first use.
+    """
+    cells = (np.arange(FIELD_SIZE) + 0.5) * FIELD_CELL
+    x, y = np.meshgrid(cells, cells)
+    lat, lon = svg_to_latlon((x.ravel(), y.ravel()))
+    latlon = np.column_stack((lat, lon))
+    vectors = unit_vectors(np.radians(lat), np.radians(lon))
+
+    # The nearest township has the largest dot product of the unit vectors
+    nearest = np.concatenate([
+        np.argmax(vectors[i:i + NEAREST_CHUNK] @ TOWN_TABLE.vectors.T, axis=1)
+        for i in range(0, len(vectors), NEAREST_CHUNK)
+    ])
+
+    return GeoTable(range(FIELD_SIZE * FIELD_SIZE), latlon, fallback=TOWN_TABLE.site_effect[nearest])
+
+
+def intensity_field(eq_data: dict, model: str = DEFAULT_MODEL) -> np.ndarray:
+    """Return the intensity scale of every map cell as a `FIELD_SIZE` square uint8 array."""
+    scales = round_intensitys(estimate_event(eq_data, grid_table(), model))
+
+    return scales.astype(np.uint8).reshape(FIELD_SIZE, FIELD_SIZE)
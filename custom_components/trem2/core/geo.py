@@ -0,0 +1,157 @@
+"""Precomputed geodesic tables for Taiwan Real-time Earthquake Monitoring integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+
+import numpy as np
+
+from .const import COUNTY_CENTERS, COUNTY_SITE_VALUES, EARTH_RADIUS, TOWN_CENTERS
+from .sitegrid import site_grid
+
+DEFAULT_SITE_EFFECT = 1.751
+SITE_TABLE_CACHE_SIZE = 8
+
+
+def unit_vectors(lat, lon) -> np.ndarray:
+    """Return the unit vectors of points on the sphere, the inputs are radians and the result has 3 columns."""
+    cos_lat = np.cos(lat)
+
+    return np.stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)), axis=-1)
+
+
+class GeoTable:
+    """A fixed set of points held as unit vectors.
+
+    The trigonometry of the points is done once, the distance from an
+    epicenter to every point is one dot product per point. The chord
+    length is converted back to the central angle, which keeps the
+    precision of short distances.
+
+    The site effect of a point is the given value, else the site
+    amplification grid if it covers the point, else the fallback. The
+    grid is only sampled when a point has no given value, on first use.
+    """
+
+    __slots__ = ("_site_effect", "fallback", "given", "keys", "lat", "lon", "vectors")
+
+    def __init__(self, keys, latlon, site_effect=None, fallback=None) -> None:
+        """Initialize the table, `latlon` is in degrees with one row per key, NaN site effects are not given."""
+        latlon = np.radians(np.asarray(latlon, dtype=np.float64).reshape(-1, 2))
+
+        self.keys = tuple(keys)
+        self.lat = np.ascontiguousarray(latlon[:, 0])
+        self.lon = np.ascontiguousarray(latlon[:, 1])
+        self.vectors = unit_vectors(self.lat, self.lon)
+        self.given = np.full(len(self.keys), np.nan) if site_effect is None else np.asarray(site_effect, np.float64)
+        self.fallback = np.broadcast_to(DEFAULT_SITE_EFFECT if fallback is None else fallback, self.given.shape)
+        self._site_effect: np.ndarray | None = None
+
+    @property
+    def site_effect(self) -> np.ndarray:
+        """Return the site effect of every point."""
+        if self._site_effect is None:
+            site_effect = self.given.copy()
+            missing = np.isnan(site_effect)
+            if missing.any() and (grid := site_grid()) is not None:
+                site_effect[missing] = grid.sample(np.degrees(self.lat[missing]), np.degrees(self.lon[missing]))
+                missing = np.isnan(site_effect)
+
+            site_effect[missing] = self.fallback[missing]
+            self._site_effect = site_effect
+
+        return self._site_effect
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self.keys)
+
+    def central_angles(self, lat, lon) -> np.ndarray:
+        """Return the central angles in radians from the epicenters in degrees to every point.
+
+        A single epicenter returns one value per point, arrays of epicenters
+        return one row per epicenter.
+        """
+        epicenter = unit_vectors(np.radians(lat), np.radians(lon))
+        chord_squared = np.clip(2 - 2 * (epicenter @ self.vectors.T), 0, 4)
+
+        return 2 * np.arcsin(np.sqrt(chord_squared) / 2)
+
+    def distances(self, lat, lon) -> np.ndarray:
+        """Return the epicentral distances in km, see `central_angles`."""
+        return self.central_angles(lat, lon) * EARTH_RADIUS
+
+
+def _county_table() -> GeoTable:
+    """Build the table of the county centers, in `COUNTY_CENTERS` order."""
+    return GeoTable(
+        COUNTY_CENTERS,
+        list(COUNTY_CENTERS.values()),
+        [COUNTY_SITE_VALUES.get(county_id) or DEFAULT_SITE_EFFECT for county_id in COUNTY_CENTERS],
+    )
+
+
+def _town_table() -> GeoTable:
+    """Build the table of the township centers, ordered by ZIP3 code.
+
+    No per-township site effects ship with the integration, there is no
+    published per-township table to take them from. Townships use the site
+    grid where it has data and the value of their county elsewhere.
+    """
+    towns = sorted(
+        (zip3, county_id, latlon) for county_id, town in TOWN_CENTERS.items() for zip3, latlon in town.items()
+    )
+
+    return GeoTable(
+        [zip3 for zip3, _, _ in towns],
+        [latlon for _, _, latlon in towns],
+        fallback=[COUNTY_SITE_VALUES.get(county_id) or DEFAULT_SITE_EFFECT for _, county_id, _ in towns],
+    )
+
+
+COUNTY_TABLE = _county_table()
+TOWN_TABLE = _town_table()
+
+
+def parse_sites(
+    text: str | None,
+    key: Callable[[str], str] | None = None,
+) -> tuple[tuple[str, float, float, float | None], ...]:
+    """Parse one site per line as "name, lat, lon[, site_effect]", e.g. "Office, 25.04, 121.56, 1.2".
+
+    Lines which cannot be parsed or repeat a name are ignored, `key` maps
+    the names compared for repeats, e.g. to the slug of the entity id. The
+    result is hashable and can be passed to `site_table`.
+    """
+    sites: dict[str, tuple[str, float, float, float | None]] = {}
+    for line in (text or "").splitlines():
+        name, *values = (value.strip() for value in line.split(","))
+        site_key = key(name) if key and name else name
+        if not name or site_key in sites or len(values) not in {2, 3}:
+            continue
+
+        try:
+            lat, lon, *site_effect = (float(value) for value in values)
+        except ValueError:
+            continue
+
+        if -90 <= lat <= 90 and -180 <= lon <= 180:
+            sites[site_key] = (name, lat, lon, site_effect[0] if site_effect and site_effect[0] > 0 else None)
+
+    return tuple(sites.values())
+
+
+@lru_cache(maxsize=SITE_TABLE_CACHE_SIZE)
+def site_table(sites: tuple[tuple[str, float, float, float | None], ...]) -> GeoTable:
+    """Return the table of configured sites such as the home zone, as `(name, lat, lon, site_effect)`.
+
+    The sites come from the configuration and rarely change, so the
+    tables are cached by their content. Sites without a site effect
+    sample the site amplification grid.
+    """
+    return GeoTable(
+        [name for name, _, _, _ in sites],
+        [(lat, lon) for _, lat, lon, _ in sites],
+        [site_effect or np.nan for _, _, _, site_effect in sites],
+    )
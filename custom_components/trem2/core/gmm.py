@@ -0,0 +1,107 @@
+"""Ground motion models for Taiwan Real-time Earthquake Monitoring integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from timeit import Timer
+
+import numpy as np
+
+from .geo import COUNTY_TABLE, TOWN_TABLE, GeoTable
+
+BENCHMARK_MAGNITUDE = 6.0
+BENCHMARK_DEPTH = 10.0
+BENCHMARK_REPEAT = 200
+DEFAULT_MODEL = "trem"
+
+
+@dataclass(frozen=True, slots=True)
+class GroundMotionModel:
+    """A ground motion model behind the common array interface.
+
+    `function` takes arrays of the magnitude, the hypocentral distance and
+    the depth in km and the site effect, which broadcast together, and
+    returns the intensity. The model is hashable and is part of the key of
+    the estimate cache, bump `version` when its coefficients change.
+    """
+
+    name: str
+    function: Callable[..., np.ndarray]
+    version: int = 1
+
+    def __call__(self, magnitude, hypocenter_distance, depth, site_effect) -> np.ndarray:
+        """Evaluate the model, the logarithm of a zero distance yields inf instead of a warning."""
+        with np.errstate(divide="ignore", over="ignore"):
+            return self.function(magnitude, hypocenter_distance, depth, site_effect)
+
+
+def pga_intensity(magnitude, hypocenter_distance, depth, site_effect) -> np.ndarray:
+    """Return the intensity of the PGA attenuation, converted by I = 2 log10(PGA) + 0.7."""
+    pga = 1.657 * np.exp(1.533 * magnitude) * hypocenter_distance**-1.607 * site_effect
+
+    return 2 * np.log10(pga) + 0.7
+
+
+def pgv_intensity(magnitude, hypocenter_distance, depth, site_effect) -> np.ndarray:
+    """Return the intensity of the Si and Midorikawa PGV attenuation, converted by I = 2.68 + 1.72 log10(PGV).
+
+    The fault length is taken off the distance. The PGV on a 600 m/s site
+    is scaled to 400 m/s, the site amplification is 1.0.
+    """
+    long = 10 ** (0.5 * magnitude - 1.85) / 2
+    x = np.maximum(hypocenter_distance - long, 3)
+    pgv600 = 10 ** (
+        0.58 * magnitude + 0.0038 * depth - 1.29 - np.log10(x + 0.0028 * 10 ** (0.5 * magnitude)) - 0.002 * x
+    )
+    pgv = pgv600 * 1.31 * 1.0
+
+    return 2.68 + 1.72 * np.log10(pgv)
+
+
+def trem_intensity(magnitude, hypocenter_distance, depth, site_effect) -> np.ndarray:
+    """Return the intensity of the PGA model, the PGV model takes over above intensity 3."""
+    intensity = pga_intensity(magnitude, hypocenter_distance, depth, site_effect)
+
+    return np.where(
+        intensity > 3,
+        pgv_intensity(magnitude, hypocenter_distance, depth, site_effect),
+        intensity,
+    )
+
+
+GROUND_MOTION_MODELS: dict[str, GroundMotionModel] = {
+    model.name: model
+    for model in (
+        GroundMotionModel("trem", trem_intensity),
+        GroundMotionModel("pga", pga_intensity),
+        GroundMotionModel("pgv", pgv_intensity),
+    )
+}
+
+
+def get_model(name: str | None = None) -> GroundMotionModel:
+    """Return the ground motion model by name, unknown names fall back to the default."""
+    return GROUND_MOTION_MODELS.get(name or DEFAULT_MODEL) or GROUND_MOTION_MODELS[DEFAULT_MODEL]
+
+
+def benchmark_models(tables: tuple[GeoTable, ...] = (COUNTY_TABLE, TOWN_TABLE)) -> dict[str, dict[str, float]]:
+    """Time every model over the points of the tables, return the µs per evaluation.
+
+    The event sits at the first point of each table, so the distances
+    cover the same range as a real estimate. This blocks for a while and
+    belongs in a worker thread.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for table in tables:
+        lat, lon = np.degrees(table.lat[0]), np.degrees(table.lon[0])
+        distance = np.sqrt(table.distances(lat, lon) ** 2 + BENCHMARK_DEPTH**2)
+        site_effect = table.site_effect
+        for name, model in GROUND_MOTION_MODELS.items():
+            timer = Timer(lambda: model(BENCHMARK_MAGNITUDE, distance, BENCHMARK_DEPTH, site_effect))  # noqa: B023
+            results.setdefault(name, {})[f"{len(table)}_points"] = round(
+                min(timer.repeat(repeat=3, number=BENCHMARK_REPEAT)) / BENCHMARK_REPEAT * 1e6,
+                2,
+            )
+
+    return results
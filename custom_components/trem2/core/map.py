@@ -1,12 +1,13 @@
 """Drawing isoseismal map for Taiwan Real-time Earthquake Monitoring integration."""
 
 from datetime import datetime
-from io import BytesIO
+from functools import lru_cache
+from itertools import groupby
+from math import ceil, floor
+import os
 
 from defusedxml import ElementTree as ET
-from reportlab.graphics import renderSVG
 import segno
-from svglib.svglib import svg2rlg
 
 from .const import (
     COUNTY_CENTERS,
@@ -21,12 +22,23 @@ from .const import (
 )
 from .earthquake import intensity_to_text, round_intensity
 
+QR_CODE_CACHE_SIZE = 16
+QR_CODE_SCALE = 9
+QR_CODE_SIZE = 500
+
+# Boxes (left, top, width, height) of the overlays on the map, their strokes included
+type Box = tuple[int, int, int, int]
+MAP_BOX: Box = (0, 0, 1000, 1000)
+INFO_BOX: Box = (9, 9, 302, 392)
+QR_CODE_BOX: Box = (869, 9, 122, 122)
+EPICENTER_RADIUS = 82
+
 TW_MAP_SVG = {
     "head": """
         <?xml version="1.0" encoding="UTF-8"?>
         <svg width="1000" height="1000" fill="#808080" stroke="#fff" baseProfile="tiny" xmlns="http://www.w3.org/2000/svg">
-        <rect x="0" y="0" width="1000" height="1000" fill="#2D2926" opacity="1" />
     """,  # noqa: E501
+    "background": '<rect x="0" y="0" width="1000" height="1000" fill="#2D2926" opacity="1" />',
     "TWKIN": '<path d="m181.2 423.5v0.1l-1.1-0.4-0.3-0.4 0.6-1.2-1.3-0.9-0.2-0.3-0.1-0.1-2.5-1.9-1.8-1.9-2.7 1-1.3 1.6 0.2 0.7-0.1 0.6-0.3 0.2-0.3-0.1-0.4 2.4-5 5.9-11.4-4.1 0.2 1-0.2 1-0.3 0.1 1.1 1.1-0.4 8.2-3.3 2.6 2.5 2.7-1.4-0.6-1.9-0.2-1.7-0.7-0.9-1.5 0.3-0.6 1.6-1.9 0.5-1 0.1-1.4v-1.8l-0.6-3.1-1.2-3-0.2-1.6 1.1-0.6 5.5-2.7 7.2 4.7 5-0.6 0.8-6.3 1.7-3.9 5.3-1.1 5.2 4.7 2 5.3zm0.2 10.5 0.3-2.1h0.3l-0.2 1.7-0.4 0.4zm0.9-5-1-3 0.1-0.7 0.3-0.4 0.8 2.4-0.2 1.7z" id="TWKIN" fill="{TWKIN_COLOR}"></path>',  # noqa: E501
     "TWLIE": '<path d="m181.2 423.5v0.1l-1.1-0.4-0.3-0.4 0.6-1.2-1.3-0.9-0.2-0.3-0.1-0.1-2.5-1.9-1.8-1.9-2.7 1-1.3 1.6 0.2 0.7-0.1 0.6-0.3 0.2-0.3-0.1-0.4 2.4-5 5.9-11.4-4.1 0.2 1-0.2 1-0.3 0.1 1.1 1.1-0.4 8.2-3.3 2.6 2.5 2.7-1.4-0.6-1.9-0.2-1.7-0.7-0.9-1.5 0.3-0.6 1.6-1.9 0.5-1 0.1-1.4v-1.8l-0.6-3.1-1.2-3-0.2-1.6 1.1-0.6 5.5-2.7 7.2 4.7 5-0.6 0.8-6.3 1.7-3.9 5.3-1.1 5.2 4.7 2 5.3zm0.2 10.5 0.3-2.1h0.3l-0.2 1.7-0.4 0.4zm0.9-5-1-3 0.1-0.7 0.3-0.4 0.8 2.4-0.2 1.7z" id="TWLIE" fill="{TWLIE_COLOR}"></path>',  # noqa: E501
     "TWPEN": '<path d="m409.7 611.6 0.9 2.9 -0.4 2.2 -1.4 -1.4 -1.9 -1.3 -2 -0.4 -2.8 1.6 -2.1 0.3 -1 0.5 -0.5 1.1 -0.8 2.9 -0.5 0.9 -3.4 2 -3.4 0.5 -3.5 -1.4 -3.5 -3.5 0.9 -1.8 1.9 2.3 2.3 2.9 0.6 3.1 -0.8 2.6 -2.1 -1.8 -0.7 -1.4 -0.8 -1.1 -1.2 -1 -1.6 -0.4 0.7 v 0.2 l -0.2 0.2 -0.7 0.4 -0.2 -2.9 0.2 -2.9 h 1.3 l 1.5 0.4 5.3 -3.4 3.4 -1.1 -0.9 3.2 -0.4 0.9 2.9 -0.9 2.2 0.3 1.6 -0.2 1.2 -1.9 3.4 6.2 z" id="TWPEN" fill="{TWPEN_COLOR}"></path>',  # noqa: E501
@@ -52,7 +64,7 @@ TW_MAP_SVG = {
     "qrcode": """
         <g id="qrcode" transform="translate(870 10)">
           <rect width="120" height="120" fill="#fff" />
-          <g transform="scale(0.27) translate(-27, -27)">{qr_code}</g>
+          <g transform="scale(0.24)">{qr_code}</g>
         </g>
     """,
     "info": """
@@ -117,6 +129,68 @@ OFFSHORE_ZONES = {
 }
 
 
+def _compile_county_template() -> tuple[tuple[str, bytes, bytes], ...]:
+    """Compile the county paths into pre-encoded segments around a colour slot.
+
+    Each entry is ``(county_id, before, after)``, a county is drawn by joining
+    ``before + color + after`` without any string formatting.
+    """
+    template = []
+
+    for county_id in COUNTY_CENTERS:
+        if county_id not in TW_MAP_SVG:
+            continue
+
+        before, after = TW_MAP_SVG[county_id].split(f"{{{county_id}_COLOR}}")
+        template.append((county_id, before.encode(), after.encode()))
+
+    return tuple(template)
+
+
+COUNTY_TEMPLATE = _compile_county_template()
+COLOR_BYTES = {k: v.encode() for k, v in INTENSITY_COLORS.items()}
+DEFAULT_COLOR_BYTES = DEFAULT_COLOR.encode()
+SVG_HEAD = TW_MAP_SVG["head"].strip().encode()
+SVG_BACKGROUND = TW_MAP_SVG["background"].encode()
+SVG_LEGEND = TW_MAP_SVG["legend"].encode()
+SVG_COPYRIGHT = TW_MAP_SVG["copyright"].encode()
+SVG_END = TW_MAP_SVG["end"].encode()
+SVG_LAYER_HEAD = (
+    '<svg width="{2}" height="{3}" viewBox="{0} {1} {2} {3}" fill="#808080" stroke="#fff" baseProfile="tiny" '
+    'xmlns="http://www.w3.org/2000/svg">'
+)
+
+
+def clip_box(left: float, top: float, right: float, bottom: float) -> Box:
+    """Return the smallest box on the map which holds the edges, rounded outwards to whole pixels."""
+    left, top = max(floor(left), 0), max(floor(top), 0)
+    right, bottom = min(ceil(right), MAP_BOX[2]), min(ceil(bottom), MAP_BOX[3])
+
+    return left, top, max(right - left, 0), max(bottom - top, 0)
+
+
+def _compile_offshore_zones() -> dict[str, tuple[tuple[bytes, Box], ...]]:
+    """Split the offshore zones into one fragment per rectangle, with the box it covers.
+
+    The Sea zone frames the whole map, a single box around it would be as
+    large as the map.
+    """
+    zones = {}
+
+    for zone, svg in OFFSHORE_ZONES.items():
+        rects = []
+        for rect in ET.fromstring(f"<g>{svg}</g>"):
+            rect.tail = None
+            x, y, width, height = (float(rect.get(key, 0)) for key in ("x", "y", "width", "height"))
+            rects.append((ET.tostring(rect), clip_box(x - 1, y - 1, x + width + 1, y + height + 1)))
+        zones[zone] = tuple(rects)
+
+    return zones
+
+
+OFFSHORE_FRAGMENTS = _compile_offshore_zones()
+
+
 def latlon_to_svg(
     epicenter_latlong,
     center_latlong=TAIWAN_CENTER,
@@ -187,6 +261,33 @@ def latlon_to_svg(
     return max(0, min(xy[0], viewbox[0])), max(0, min(xy[1], viewbox[1]))
 
 
+def svg_to_latlon(
+    xy,
+    center_latlong=TAIWAN_CENTER,
+    center_xy=(658.6, 552),
+    viewbox=(1000, 1000),
+):
+    """Convert SVG coordinates back to latitude and longitude, the inverse of `latlon_to_svg`.
+
+    The coordinates are not clamped, so `xy` may also hold NumPy arrays
+    of x and y.
+    """
+    # Latlong bounds for Taiwan
+    min_lon, max_lon = 117, 124
+    min_lat, max_lat = 20, 26
+
+    # Calculate the pixel per degree
+    pixels_per = (
+        viewbox[0] / (max_lon - min_lon),
+        viewbox[1] / (max_lat - min_lat),
+    )
+
+    return (
+        center_latlong[0] - (xy[1] - center_xy[1]) / pixels_per[0],
+        center_latlong[1] + (xy[0] - center_xy[0]) / pixels_per[1],
+    )
+
+
 def is_offshore(latlong: tuple[float, float] | tuple[None, None]) -> str | None:
     """Check if the epicenter is offshore."""
     lat, lon = latlong
@@ -233,9 +334,14 @@ def mag_to_intensity(mag):
     return 9
 
 
-def generate_qr_code(url, bg_svg, scale=9):
+def generate_qr_code(url, bg_svg, scale=QR_CODE_SCALE):
     """Generate a QR code and overlay it on a background SVG.
 
+    The QR modules are emitted straight from the segno matrix as one
+    run-length merged path, centered on the background logo which is parsed
+    once per file. The result is memoized on the url, the background path,
+    its modification time and the scale.
+
     Parameters
     ----------
     url : str
@@ -257,67 +363,106 @@ def generate_qr_code(url, bg_svg, scale=9):
             bg_svg="/path/to/background.svg",
             scale=9
         )
-    '<g id="qrcode" transform="translate(870 10)">...</g>'
+    '<g fill="#000" stroke="none">...</g>'
 
     """
+    if bg_svg is None:
+        return _generate_qr_code_cached(url, None, None, scale)
+
+    if isinstance(bg_svg, str | os.PathLike):
+        bg_mtime = _file_mtime(bg_svg)
+        bg_svg = os.fspath(bg_svg)
+
+        return _generate_qr_code_cached(url, bg_svg, bg_mtime, scale)
+
+    return _generate_qr_code(url, _parse_qr_background(bg_svg), scale)
+
+
+@lru_cache(maxsize=QR_CODE_CACHE_SIZE)
+def _generate_qr_code_cached(url, bg_svg, bg_mtime, scale):
+    """Generate a QR code, memoized, `bg_mtime` invalidates a changed background."""
+    return _generate_qr_code(url, _load_qr_background(bg_svg, bg_mtime), scale)
+
+
+def _generate_qr_code(url, background: str, scale) -> str:
+    """Generate a QR code centered on a pre-parsed background fragment."""
     qrcode = segno.make(
         url,
         error="h",
     )
 
-    # Convert QR code to ByteIO object
-    qr_svg = BytesIO()
-    qrcode.save(qr_svg, scale=scale, kind="svg")
-    qr_svg.seek(0)
+    # Center the symbol and its quiet zone on the background
+    width, _ = qrcode.symbol_size(scale=scale)
+    offset = (QR_CODE_SIZE - width) / 2 + qrcode.default_border_size * scale
+
+    return (
+        '<g fill="#000" stroke="none">'
+        f"{background}"
+        f'<path transform="translate({offset:g} {offset:g}) scale({scale:g})" d="{_qr_code_path(qrcode.matrix)}" />'
+        "</g>"
+    )
+
 
-    # Using svglib to convert SVG to drawing
-    bg_drawing = svg2rlg(bg_svg)
-    qr_drawing = svg2rlg(qr_svg)
+def _qr_code_path(matrix) -> str:
+    """Convert the QR code matrix into path data, one subpath per run of dark modules."""
+    path_data = []
 
-    element = None
-    if bg_drawing and qr_drawing:
-        # Get the background dimensions
-        bg_width = bg_drawing.width
-        bg_height = bg_drawing.height
+    for y, row in enumerate(matrix):
+        x = 0
+        for is_dark, modules in groupby(row):
+            length = len(tuple(modules))
+            if is_dark:
+                path_data.append(f"M{x} {y}h{length}v1h-{length}z")
+            x += length
 
-        # Get the QR Code dimensions
-        qr_width = qr_drawing.width
-        qr_height = qr_drawing.height
+    return "".join(path_data)
 
-        # Calculate the position to center the QR Code
-        x_offset = (bg_width - qr_width) / 2
-        y_offset = (bg_height - qr_height) / 2
 
-        # Set the QR Code position to the center of the background
-        qr_drawing.translate(x_offset, y_offset)
+def _file_mtime(path) -> int | None:
+    """Return the modification time of a file, or None if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
-        # Marge the QR Code with the background
-        bg_drawing.add(qr_drawing)
+@lru_cache(maxsize=QR_CODE_CACHE_SIZE)
+def _load_qr_background(bg_svg: str, bg_mtime: int | None) -> str:
+    """Load a background SVG once, `bg_mtime` invalidates a changed file."""
+    if bg_mtime is None:
+        return ""
 
-        # Convert the drawing to SVG string
-        qr_data = renderSVG.drawToString(bg_drawing).replace("\n", "").replace("\t", "")
-        qr_svg = ET.fromstring(qr_data)
+    return _parse_qr_background(bg_svg)
 
-        # Define the namespace for SVG
-        namespaces = {"ns0": "http://www.w3.org/2000/svg"}
-        element = qr_svg.find(".//ns0:g[@id='group']", namespaces=namespaces)
 
-    if element is not None:
-        # Remove the namespace from the tag
-        for elem in element.iter():
-            if elem.tag.startswith("{"):
-                elem.tag = elem.tag.split("}", 1)[1]
+def _parse_qr_background(bg_svg) -> str:
+    """Parse a background SVG into a `<g>` fragment scaled to the QR code canvas."""
+    if bg_svg is None:
+        return ""
 
-        # Look for the QR code element
-        qr_element = element.find(".//g")
+    try:
+        root = ET.parse(bg_svg).getroot()
+    except (OSError, ValueError, ET.ParseError):
+        return ""
 
-        if qr_element is not None:
-            qr_element.set("transform", "scale(1,-1) translate(0,-500)")
+    # Remove the namespace from the tag
+    for elem in root.iter():
+        if elem.tag.startswith("{"):
+            elem.tag = elem.tag.split("}", 1)[1]
 
-            # Covert to string
-            return ET.tostring(qr_element, encoding="unicode")
+    # Fit the view box of the background to the QR code canvas
+    view_box = root.get("viewBox")
+    if view_box:
+        min_x, min_y, width, height = map(float, view_box.replace(",", " ").split())
+    else:
+        min_x = min_y = 0
+        width = float(root.get("width", str(QR_CODE_SIZE)).removesuffix("px"))
+        height = float(root.get("height", str(QR_CODE_SIZE)).removesuffix("px"))
 
-    return None
+    content = "".join(ET.tostring(child, encoding="unicode") for child in root)
+    transform = f"scale({QR_CODE_SIZE / width:g} {QR_CODE_SIZE / height:g}) translate({-min_x:g} {-min_y:g})"
+
+    return f'<g transform="{transform}">{content}</g>'
 
 
 def draw(intensitys: dict, eq_data: dict, eq_id="XXXXXXX-X", bg_path=None, url=None):
@@ -362,6 +507,11 @@ def draw(intensitys: dict, eq_data: dict, eq_id="XXXXXXX-X", bg_path=None, url=N
         The text required to generate the QR code.
         Format: String.
 
+    Returns
+    -------
+    svg : bytes
+        The UTF-8 encoded SVG document, ready to be rasterized.
+
     Examples
     --------
     >>> draw(
@@ -389,75 +539,185 @@ def draw(intensitys: dict, eq_data: dict, eq_id="XXXXXXX-X", bg_path=None, url=N
             bg_path="/path/to/background.svg",
             url="https://www.gj-smart.com/"
         )
-    '<svg>...</svg>'
+    b'<?xml version="1.0" encoding="UTF-8"?><svg>...</svg>'
 
     """
     # Draw SVG from head starting
-    svg_parts = [TW_MAP_SVG["head"]]
+    svg_parts = [SVG_HEAD, SVG_BACKGROUND]
+
+    # Add Taiwan map, epicenter, earthquake information and QR code
+    _draw_dynamic(svg_parts, intensitys, eq_data, eq_id, bg_path, url, DEFAULT_COLOR_BYTES)
 
+    # Add legend, copyright, and end tag
+    svg_parts.append(SVG_LEGEND)
+    svg_parts.append(SVG_COPYRIGHT)
+    svg_parts.append(SVG_END)
+
+    # Join all SVG parts into a single document
+    return b"\n".join(svg_parts)
+
+
+def draw_base() -> bytes:
+    """Draw the static bottom layer, the background and the uncolored counties."""
+    svg_parts = [SVG_HEAD, SVG_BACKGROUND]
+    _draw_intensitys(svg_parts, {})
+    svg_parts.append(SVG_END)
+
+    return b"\n".join(svg_parts)
+
+
+def draw_foreground() -> list[bytes]:
+    """Draw the static top layers, one document for the legend and one for the copyright."""
+    return [b"\n".join((SVG_HEAD, layer, SVG_END)) for layer in (SVG_LEGEND, SVG_COPYRIGHT)]
+
+
+def draw_labels() -> bytes:
+    """Draw the county label mask, county `i` in `COUNTY_TEMPLATE` is filled with rgb(i+1, i+1, i+1).
+
+    The edges are not anti-aliased, so every pixel holds exactly one label
+    and 0 means no county.
+    """
+    svg_parts = [SVG_HEAD, b'<g stroke="none" shape-rendering="crispEdges">']
+    for label, (_, before, after) in enumerate(COUNTY_TEMPLATE, start=1):
+        svg_parts.append(b"".join((before, f"rgb({label},{label},{label})".encode(), after)))
+    svg_parts.append(b"</g>")
+    svg_parts.append(SVG_END)
+
+    return b"\n".join(svg_parts)
+
+
+def draw_outlines() -> bytes:
+    """Draw the county outlines without fills on a transparent canvas."""
+    svg_parts = [SVG_HEAD]
+    svg_parts.extend(b"".join((before, b"none", after)) for _, before, after in COUNTY_TEMPLATE)
+    svg_parts.append(SVG_END)
+
+    return b"\n".join(svg_parts)
+
+
+def draw_counties(intensitys: dict, box: Box) -> bytes:
+    """Draw the background and every county inside the box.
+
+    The document covers the box alone and is opaque, it is the same as
+    that part of `draw` below the epicenter.
+    """
+    svg_parts = [SVG_LAYER_HEAD.format(*box).encode(), SVG_BACKGROUND]
+    _draw_intensitys(svg_parts, intensitys)
+    svg_parts.append(SVG_END)
+
+    return b"\n".join(svg_parts)
+
+
+def draw_layers(
+    intensitys: dict,
+    eq_data: dict,
+    eq_id="XXXXXXX-X",
+    bg_path=None,
+    url=None,
+) -> list[tuple[bytes, Box]]:
+    """Draw the epicenter, the information box and the QR code as separate documents.
+
+    Each document covers only the box of its part on a transparent canvas,
+    they are returned bottom to top with their boxes. The counties are not
+    included. The parameters are the same as `draw`.
+    """
+    return [
+        (b"".join((SVG_LAYER_HEAD.format(*box).encode(), fragment, SVG_END)), box)
+        for fragment, box in _draw_layers(intensitys, eq_data, eq_id, bg_path, url)
+    ]
+
+
+def _draw_dynamic(
+    svg_parts: list,
+    intensitys: dict,
+    eq_data: dict,
+    eq_id,
+    bg_path,
+    url,
+    default_color: bytes | None,
+):
+    """Draw the parts of the map that depend on the earthquake data."""
     # Add Taiwan map SVG parts
-    county_id, max_int = _draw_intensitys(svg_parts, intensitys)
+    _draw_intensitys(svg_parts, intensitys, default_color)
+
+    # Add epicenter, earthquake information and QR code
+    svg_parts.extend(fragment for fragment, _ in _draw_layers(intensitys, eq_data, eq_id, bg_path, url))
+
+
+def _draw_layers(intensitys: dict, eq_data: dict, eq_id, bg_path, url) -> list[tuple[bytes, Box]]:
+    """Draw the parts above the counties, each fragment with the box it covers."""
+    county_id, max_int = _max_intensity(intensitys)
     county_name = COUNTY_NAME.get(county_id, county_id)
     max_int = intensity_to_text(round_intensity(max_int))
 
     # Add epicenter and earthquake information
-    _draw_epicenter(svg_parts, eq_data, eq_id, county_name, max_int)
+    eq: dict = eq_data.get("eq", {})
+    layers, loc_main, loc_spec = _draw_epicenter(eq)
+    layers.append((_draw_info(eq_data, eq_id, county_name, max_int, loc_main, loc_spec), INFO_BOX))
 
     # Add QR code if URL is provided
-    _add_qr_code(svg_parts, url, bg_path)
-
-    # Add legend, copyright, and end tag
-    svg_parts.append(TW_MAP_SVG["legend"])
-    svg_parts.append(TW_MAP_SVG["copyright"])
-    svg_parts.append(TW_MAP_SVG["end"])
+    if url:
+        layers.append((_draw_qr_code(url, bg_path), QR_CODE_BOX))
 
-    # Join all SVG parts into a single string
-    return "\n".join(svg_parts)
+    return layers
 
 
-def _draw_intensitys(svg_parts: list, intensitys: dict):
-    """Draw counties on the map."""
+def _max_intensity(intensitys: dict) -> tuple[str, float]:
+    """Return the first county with the highest intensity and its intensity."""
     max_county_id = ""
     max_intensity = 0
 
-    for county_id in COUNTY_CENTERS:
-        if county_id in TW_MAP_SVG:
-            intensity = intensitys.get(county_id, 0)
-            if intensity > max_intensity:
-                max_county_id = county_id
-                max_intensity = intensity
+    for county_id, _, _ in COUNTY_TEMPLATE:
+        intensity = intensitys.get(county_id, 0)
+        if intensity > max_intensity:
+            max_county_id = county_id
+            max_intensity = intensity
 
-            intensity_color = INTENSITY_COLORS.get(round_intensity(intensity), DEFAULT_COLOR)
-            path_content = TW_MAP_SVG[county_id].replace(f"{{{county_id}_COLOR}}", intensity_color)
+    return max_county_id, max_intensity
 
-            svg_parts.append(path_content)
 
-    return max_county_id, max_intensity
+def _draw_intensitys(svg_parts: list, intensitys: dict, default_color: bytes | None = DEFAULT_COLOR_BYTES):
+    """Draw counties on the map, counties are skipped if `default_color` is None."""
+    chunks = []
 
+    for county_id, before, after in COUNTY_TEMPLATE:
+        intensity_color = COLOR_BYTES.get(round_intensity(intensitys.get(county_id, 0)), default_color)
+        if intensity_color is not None:
+            chunks += (before, intensity_color, after, b"\n")
 
-def _draw_epicenter(svg_parts: list, eq_data: dict, eq_id, county_name, max_intensity):
-    """Draw the epicenter and earthquake information."""
-    eq: dict = eq_data.get("eq", {})
+    svg_parts.append(b"".join(chunks))
+
+
+def _draw_epicenter(eq: dict) -> tuple[list[tuple[bytes, Box]], str, str]:
+    """Draw the epicenter, return its fragments with their boxes and the location."""
     epi_latlong = (eq.get("lat"), eq.get("lon"))
     epicenter = is_offshore(epi_latlong)
 
     match epicenter:
         case None:
-            loc_main = "未知區域"
-            loc_spec = "震源調查中"
+            return [], "未知區域", "震源調查中"
         case "Mainland":
             epicenter_x, epicenter_y = latlon_to_svg(epi_latlong)
-            _draw_cross(svg_parts, epicenter_x, epicenter_y)
-            loc_main, loc_spec = _parse_location(eq.get("loc"), epi_latlong)
-        case _:
-            svg_parts.append(
-                OFFSHORE_ZONES.get(
-                    epicenter,
-                    OFFSHORE_ZONES["Sea"],
-                ),
+            cross: list[bytes] = []
+            _draw_cross(cross, epicenter_x, epicenter_y)
+            box = clip_box(
+                floor(epicenter_x) - EPICENTER_RADIUS,
+                floor(epicenter_y) - EPICENTER_RADIUS,
+                floor(epicenter_x) + EPICENTER_RADIUS + 1,
+                floor(epicenter_y) + EPICENTER_RADIUS + 1,
             )
-            loc_main, loc_spec = _parse_location(eq.get("loc"), epi_latlong)
+            layers = [(b"".join(cross), box)]
+        case _:
+            layers = list(OFFSHORE_FRAGMENTS.get(epicenter, OFFSHORE_FRAGMENTS["Sea"]))
+
+    loc_main, loc_spec = _parse_location(eq.get("loc"), epi_latlong)
+
+    return layers, loc_main, loc_spec
 
+
+def _draw_info(eq_data: dict, eq_id, county_name, max_intensity, loc_main, loc_spec) -> bytes:
+    """Draw the earthquake information."""
+    eq: dict = eq_data.get("eq", {})
     formatted_time = datetime.fromtimestamp(
         round(
             eq.get(
@@ -468,34 +728,33 @@ def _draw_epicenter(svg_parts: list, eq_data: dict, eq_id, county_name, max_inte
         ),
         TZ_UTC,
     ).astimezone(TZ_TW)
-    svg_parts.append(
-        TW_MAP_SVG["info"].format(
-            eq_id=eq_id,
-            loc_main=loc_main,
-            loc_spec=loc_spec,
-            time=formatted_time.strftime("%Y/%m/%d %H:%M:%S"),
-            max_intensity=" ".join(
-                map(
-                    str,
-                    (
-                        county_name,
-                        max_intensity,
-                    ),
-                )
-            ),
-            mag=eq.get("mag", "---"),
-            depth=eq.get("depth", "---"),
-            foot_note=_provider_info(
-                eq_data.get(
+
+    return TW_MAP_SVG["info"].format(
+        eq_id=eq_id,
+        loc_main=loc_main,
+        loc_spec=loc_spec,
+        time=formatted_time.strftime("%Y/%m/%d %H:%M:%S"),
+        max_intensity=" ".join(
+            map(
+                str,
+                (
+                    county_name,
+                    max_intensity,
+                ),
+            )
+        ),
+        mag=eq.get("mag", "---"),
+        depth=eq.get("depth", "---"),
+        foot_note=_provider_info(
+            eq_data.get(
+                "author",
+                eq.get(
                     "author",
-                    eq.get(
-                        "author",
-                        "Unknown",
-                    ),
-                )
-            ),
+                    "Unknown",
+                ),
+            )
         ),
-    )
+    ).encode()
 
 
 def _provider_info(author: str) -> str:
@@ -510,13 +769,15 @@ def _draw_cross(svg_parts: list, epicenter_x, epicenter_y):
     """Draw a cross at the epicenter."""
     cross1_x = f'x1="{epicenter_x - 10}" x2="{epicenter_x + 10}"'
     cross1_y = f'y1="{epicenter_y - 10}" y2="{epicenter_y + 10}"'
-    svg_parts.append(f'<line {cross1_x} {cross1_y} stroke="red" stroke-width="5" />')
+    svg_parts.append(f'<line {cross1_x} {cross1_y} stroke="red" stroke-width="5" />'.encode())
 
     cross2_x = f'x1="{epicenter_x + 10}" x2="{epicenter_x - 10}"'
     cross2_y = f'y1="{epicenter_y - 10}" y2="{epicenter_y + 10}"'
-    svg_parts.append(f'<line {cross2_x} {cross2_y} stroke="red" stroke-width="5" />')
+    svg_parts.append(f'<line {cross2_x} {cross2_y} stroke="red" stroke-width="5" />'.encode())
 
-    svg_parts.append(f'<circle style="fill:#2e364f;fill-opacity:0.5" cx="{epicenter_x}" cy="{epicenter_y}" r="80" />')
+    svg_parts.append(
+        f'<circle style="fill:#2e364f;fill-opacity:0.5" cx="{epicenter_x}" cy="{epicenter_y}" r="80" />'.encode()
+    )
 
 
 def _parse_location(loc: str | None, epi_latlong: tuple | None = None) -> tuple[str, str]:
@@ -559,8 +820,8 @@ def _decimal_to_dms(degree):
     return d, m, s
 
 
-def _add_qr_code(svg_parts: list, url, bg_path):
-    """Add QR code to the SVG."""
-    if url:
-        qrcode_svg = generate_qr_code(url, bg_path, 9)
-        svg_parts.append(TW_MAP_SVG["qrcode"].format(qr_code=qrcode_svg))
+def _draw_qr_code(url, bg_path) -> bytes:
+    """Draw the QR code."""
+    qrcode_svg = generate_qr_code(url, bg_path, QR_CODE_SCALE)
+
+    return TW_MAP_SVG["qrcode"].format(qr_code=qrcode_svg).encode()
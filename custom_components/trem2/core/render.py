@@ -0,0 +1,461 @@
+"""Rasterize isoseismal map for Taiwan Real-time Earthquake Monitoring integration."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from threading import Lock
+from timeit import Timer
+
+import numpy as np
+from pyvips import Image
+
+from .const import INTENSITY_COLORS
+from .earthquake import round_intensity
+from .field import FIELD_SIZE, intensity_field
+from .gmm import DEFAULT_MODEL
+from .map import (
+    COUNTY_TEMPLATE,
+    Box,
+    clip_box,
+    draw,
+    draw_base,
+    draw_counties,
+    draw_foreground,
+    draw_labels,
+    draw_layers,
+    draw_outlines,
+)
+
+# Output format: (content type, file suffix)
+IMAGE_FORMATS: dict[str, tuple[str, str]] = {
+    "png": ("image/png", ".png"),
+    "png8": ("image/png", ".png"),
+    "webp": ("image/webp", ".webp"),
+    "jpeg": ("image/jpeg", ".jpg"),
+}
+MAP_SIZE = 1000
+
+# The effort option ranges from 0 to 9, the encoders are scaled onto it
+EFFORT_MAX = 9
+DEFAULT_EFFORT = 4
+PALETTE_EFFORT_MAX = 7
+WEBP_EFFORT_MAX = 6
+
+# Same colours as the background and the county fill of `TW_MAP_SVG`
+BACKGROUND_RGBA = (0x2D, 0x29, 0x26, 255)
+COUNTY_RGBA = (0x80, 0x80, 0x80, 255)
+FIELD_ALPHA = 160
+
+# The QR code and the offshore zones repeat between events
+LAYER_CACHE_SIZE = 8
+
+BENCHMARK_EVENT = {
+    "author": "cwa",
+    "id": "1140887",
+    "serial": 2,
+    "eq": {"time": 1744126016000, "lon": 121.17, "lat": 23.54, "depth": 15.3, "mag": 5.9, "loc": "花蓮縣", "max": 4},
+}
+BENCHMARK_INTENSITYS = {"TWHUA": 4.2, "TWTTT": 3.1, "TWNAN": 2.6, "TWILA": 2.1}
+BENCHMARK_URL = "https://www.gj-smart.com/"
+BENCHMARK_REPEAT = 10
+
+
+def rasterize(svg: bytes) -> Image:
+    """Rasterize an SVG document into an RGBA image held in memory."""
+    return Image.new_from_buffer(svg, "").copy_memory()
+
+
+@lru_cache(maxsize=LAYER_CACHE_SIZE)
+def rasterize_layer(svg: bytes) -> Image:
+    """Rasterize a small overlay document, memoized."""
+    return rasterize(svg)
+
+
+def trim_layer(image: Image) -> tuple[Image, int, int]:
+    """Crop a transparent layer to its visible area, return it with its offset."""
+    left, top, width, height = image[3].find_trim(threshold=0, background=[0])
+    if width == 0 or height == 0:
+        return image, 0, 0
+
+    return image.crop(left, top, width, height).copy_memory(), left, top
+
+
+def overlaps(box: Box, other: Box) -> bool:
+    """Return True if the boxes share a pixel."""
+    return (
+        box[0] < other[0] + other[2]
+        and other[0] < box[0] + box[2]
+        and box[1] < other[1] + other[3]
+        and other[1] < box[1] + box[3]
+    )
+
+
+def parse_image_sizes(text: str | None) -> tuple[int, ...]:
+    """Parse a comma separated list of widths, e.g. "480, 200".
+
+    Widths which are not smaller than the map are ignored, the result is
+    sorted from large to small without duplicates.
+    """
+    sizes = {int(size) for size in (text or "").replace(" ", "").split(",") if size.isdigit()}
+
+    return tuple(sorted((size for size in sizes if 0 < size < MAP_SIZE), reverse=True))
+
+
+def scale_effort(effort: int, maximum: int) -> int:
+    """Scale an effort from 0 to `EFFORT_MAX` onto the range of an encoder from 0 to `maximum`."""
+    return round(min(max(effort, 0), EFFORT_MAX) * maximum / EFFORT_MAX)
+
+
+def encode(image: Image, image_format: str = "png", effort: int = DEFAULT_EFFORT) -> bytes:
+    """Encode the image, effort ranges from 0 (fastest) to 9 (smallest).
+
+    The map only uses a few flat colours, so an 8-bit palette PNG or a
+    lossless WebP is usually less than half the size of a truecolour PNG.
+    The effort is scaled onto each encoder, the upper end of the palette
+    quantizer and of WebP takes several times as long for a few percent.
+    """
+    match image_format:
+        case "png8":
+            return image.write_to_buffer(
+                ".png",
+                palette=True,
+                compression=effort,
+                effort=1 + scale_effort(effort, PALETTE_EFFORT_MAX - 1),
+            )
+        case "webp":
+            return image.write_to_buffer(".webp", lossless=True, effort=scale_effort(effort, WEBP_EFFORT_MAX))
+        case "jpeg":
+            return image.flatten(background=[255, 255, 255]).write_to_buffer(
+                ".jpg",
+                Q=90,
+                optimize_coding=effort > 0,
+            )
+
+    return image.write_to_buffer(".png", compression=effort)
+
+
+class LayeredRenderer:
+    """Composite the isoseismal map from pre-rasterized static layers.
+
+    The background, the uncoloured counties, the legend and the copyright
+    never change, they are rasterized once. Each event only rasterizes the
+    coloured counties inside their box, which is opaque and is inserted into
+    the base, and the epicenter, the information box and the QR code as
+    small documents which are composited over their own boxes. The legend
+    and the copyright are inserted as tiles flattened over the base, they
+    are only composited again where an overlay reaches them.
+    """
+
+    def __init__(
+        self,
+        image_format: str = "png",
+        effort: int = DEFAULT_EFFORT,
+        sizes: tuple[int, ...] = (),
+        field: bool = False,
+        model: str = DEFAULT_MODEL,
+    ) -> None:
+        """Initialize the renderer, `field` paints the gridded isoseismal field of the ground motion model."""
+        self.image_format = image_format if image_format in IMAGE_FORMATS else "png"
+        self.effort = effort
+        self.sizes = sizes
+        self.field = field
+        self.model = model
+        self._lock = Lock()
+        self._base: Image | None = None
+        self._county_boxes: dict[str, Box] = {}
+        self._foreground: list[tuple[Image, int, int]] = []
+        self._flat_foreground: list[tuple[Image, int, int]] = []
+        self._labels: Image | None = None
+        self._land: Image | None = None
+        self._outlines: tuple[Image, int, int] | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True if the static layers are rasterized."""
+        return self._base is not None
+
+    @property
+    def content_type(self) -> str:
+        """Return the content type of the encoded image."""
+        return IMAGE_FORMATS[self.image_format][0]
+
+    @property
+    def suffix(self) -> str:
+        """Return the file suffix of the encoded image."""
+        return IMAGE_FORMATS[self.image_format][1]
+
+    def setup(self) -> None:
+        """Rasterize the static layers, this is a no-op once done."""
+        with self._lock:
+            if self.is_ready:
+                return
+
+            self._base = self._setup_layers()
+
+    def _setup_layers(self) -> Image:
+        """Rasterize the layers shared by the renderers, return the map without an event."""
+        base = rasterize(draw_base())
+        self._foreground = [trim_layer(rasterize(svg)) for svg in draw_foreground()]
+        self._flat_foreground = [(flatten(base, layer, left, top), left, top) for layer, left, top in self._foreground]
+        self._labels = rasterize(draw_labels())[0].copy_memory()
+        self._land = (self._labels > 0).copy_memory()
+        self._county_boxes = county_boxes(self._labels)
+        self._outlines = trim_layer(rasterize(draw_outlines()))
+
+        return base
+
+    def draw_image(self, intensitys: dict, eq_data: dict, eq_id=None, bg_path=None, url=None) -> Image:
+        """Draw and rasterize the map, the parameters are the same as `core.map.draw`."""
+        self.setup()
+        base: Image = self._base  # type: ignore  # noqa: PGH003
+        overlays = overlay_layers(intensitys, eq_data, eq_id, bg_path, url)
+        field = self.field_layer(eq_data)
+        if field is not None:
+            layers = [(field, 0, 0), self._outlines, *overlays]
+            return self._composite_layers(base, layers)  # type: ignore  # noqa: PGH003
+
+        box = self.counties_box(intensitys)
+        if box is None:
+            return self._composite_layers(base, overlays)
+
+        counties = rasterize(draw_counties(intensitys, box))
+
+        return self._composite_layers(base.insert(counties, box[0], box[1]), overlays, [box])
+
+    def counties_box(self, intensitys: dict) -> Box | None:
+        """Return the box around the coloured counties, None if no county is coloured."""
+        boxes = [
+            self._county_boxes[county_id]
+            for county_id, intensity in intensitys.items()
+            if county_id in self._county_boxes and round_intensity(intensity) in INTENSITY_COLORS
+        ]
+        if not boxes:
+            return None
+
+        return clip_box(
+            min(left for left, _, _, _ in boxes),
+            min(top for _, top, _, _ in boxes),
+            max(left + width for left, _, width, _ in boxes),
+            max(top + height for _, top, _, height in boxes),
+        )
+
+    def field_layer(self, eq_data: dict) -> Image | None:
+        """Return the isoseismal field layer, None if it is disabled or the epicenter is unknown.
+
+        The field only replaces county colours which are estimates, reports
+        and observed intensity are drawn county by county as before.
+        """
+        eq: dict = eq_data.get("eq") or {}
+        if not self.field or None in (eq.get("lat"), eq.get("lon"), eq.get("mag")):
+            return None
+
+        if "md5" in eq_data or eq_data.get("intensity") or eq_data.get("list"):
+            return None
+
+        self.setup()
+
+        return field_image(intensity_field(eq, self.model), self._land)  # type: ignore  # noqa: PGH003
+
+    def _composite_layers(
+        self,
+        image: Image,
+        layers: list[tuple[Image, int, int]],
+        boxes: list[Box] | None = None,
+    ) -> Image:
+        """Composite the layers over the image, then the legend and the copyright.
+
+        The legend and the copyright are inserted as tiles flattened over the
+        base, unless a layer or one of `boxes`, which were drawn into the
+        image, reaches them.
+        """
+        image = composite_layers(image, layers)
+        boxes = [*(boxes or []), *((left, top, layer.width, layer.height) for layer, left, top in layers)]
+        for (layer, left, top), (flat, _, _) in zip(self._foreground, self._flat_foreground, strict=True):
+            if any(overlaps((left, top, layer.width, layer.height), box) for box in boxes):
+                image = composite_layers(image, [(layer, left, top)])
+            else:
+                image = image.insert(flat, left, top)
+
+        return image
+
+    def render(
+        self,
+        intensitys: dict,
+        eq_data: dict,
+        eq_id=None,
+        bg_path=None,
+        url=None,
+    ) -> tuple[bytes, dict[int, bytes]]:
+        """Draw, rasterize and encode the map, this blocks and belongs in a worker thread.
+
+        The parameters are the same as `core.map.draw`. Return the full size
+        image and the downscaled variants keyed by width, the variants are
+        shrunk from the same raster instead of drawing the map again.
+        """
+        image = self.draw_image(intensitys, eq_data, eq_id, bg_path, url)
+        if not self.sizes:
+            return encode(image, self.image_format, self.effort), {}
+
+        image = image.copy_memory()
+        variants = {size: encode(image.thumbnail_image(size), self.image_format, self.effort) for size in self.sizes}
+
+        return encode(image, self.image_format, self.effort), variants
+
+
+class MaskRenderer(LayeredRenderer):
+    """Colour the counties of the isoseismal map through a lookup table.
+
+    The counties are rasterized once into an index image, each pixel holds
+    `label * 256 + alpha`, the label of its county and the alpha of the
+    county outline over it. Each event only builds the colour table, which
+    already has the white outline blended over every colour, and maps the
+    index through it. The county fills and the outlines never go through
+    SVG parsing, path rasterization or compositing again, only the small
+    overlays are composited on top.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the renderer, the parameters are the same as `LayeredRenderer`."""
+        super().__init__(*args, **kwargs)
+        self._index: Image | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True if the index image and the static layers are rasterized."""
+        return self._index is not None
+
+    def setup(self) -> None:
+        """Rasterize the index image and the static layers, this is a no-op once done."""
+        with self._lock:
+            if self.is_ready:
+                return
+
+            self._setup_layers()
+            labels: Image = self._labels  # type: ignore  # noqa: PGH003
+            outlines, left, top = self._outlines  # type: ignore  # noqa: PGH003
+            alpha = Image.black(MAP_SIZE, MAP_SIZE).insert(outlines[3], left, top)
+            self._index = (labels.cast("ushort") * 256 + alpha).cast("ushort").copy_memory()
+
+    def draw_image(self, intensitys: dict, eq_data: dict, eq_id=None, bg_path=None, url=None) -> Image:
+        """Draw and rasterize the map, the parameters are the same as `core.map.draw`."""
+        self.setup()
+        index: Image = self._index  # type: ignore  # noqa: PGH003
+        overlays = overlay_layers(intensitys, eq_data, eq_id, bg_path, url)
+        field = self.field_layer(eq_data)
+        if field is not None:
+            # The field goes between the counties and their outlines
+            layers = [(field, 0, 0), self._outlines, *overlays]
+            counties = index.maplut(color_table({}, outlines=False))
+            return self._composite_layers(counties, layers)  # type: ignore  # noqa: PGH003
+
+        return self._composite_layers(index.maplut(color_table(intensitys)), overlays)
+
+
+def composite_layers(image: Image, layers: list[tuple[Image, int, int]]) -> Image:
+    """Composite the layers over the image at their offsets, bottom to top.
+
+    Each layer is blended over the region it covers and put back, so the
+    cost follows the size of the layers rather than the size of the map.
+    """
+    for layer, left, top in layers:
+        region = image.crop(left, top, layer.width, layer.height).composite(layer, "over")
+        image = image.insert(region, left, top)
+
+    return image
+
+
+def overlay_layers(intensitys: dict, eq_data: dict, eq_id=None, bg_path=None, url=None) -> list[tuple[Image, int, int]]:
+    """Rasterize the epicenter, the information box and the QR code at their offsets on the map."""
+    return [
+        (rasterize_layer(svg), left, top)
+        for svg, (left, top, _, _) in draw_layers(intensitys, eq_data, eq_id, bg_path, url)
+    ]
+
+
+def flatten(base: Image, layer: Image, left: int, top: int) -> Image:
+    """Composite the layer over its region of the base, return the opaque region."""
+    return base.crop(left, top, layer.width, layer.height).composite(layer, "over").copy_memory()
+
+
+def county_boxes(labels: Image) -> dict[str, Box]:
+    """Return the box of every county of the label image, widened by a pixel for the outline."""
+    array = labels.numpy()
+    boxes = {}
+    for label, (county_id, _, _) in enumerate(COUNTY_TEMPLATE, start=1):
+        rows, columns = np.nonzero(array == label)
+        if rows.size:
+            boxes[county_id] = clip_box(columns.min() - 1, rows.min() - 1, columns.max() + 2, rows.max() + 2)
+
+    return boxes
+
+
+def color_table(intensitys: dict, outlines: bool = True) -> Image:
+    """Build the RGBA lookup table of the index image, label 0 is the background.
+
+    Entry `label * 256 + alpha` holds the colour of the label with the white
+    outline blended over it at that alpha, the outline is left out if
+    `outlines` is False.
+    """
+    colors = [BACKGROUND_RGBA[:3]]
+    for county_id, _, _ in COUNTY_TEMPLATE:
+        color = INTENSITY_COLORS.get(round_intensity(intensitys.get(county_id, 0)))
+        colors.append(tuple(bytes.fromhex(color[1:])) if color else COUNTY_RGBA[:3])
+
+    alpha = np.arange(256, dtype=np.uint32)[:, None] if outlines else np.zeros((256, 1), dtype=np.uint32)
+    table = np.empty((len(colors), 256, 4), dtype=np.uint8)
+    table[..., :3] = (np.array(colors, dtype=np.uint32)[:, None, :] * (255 - alpha) + 255 * alpha + 127) // 255
+    table[..., 3] = 255
+
+    return Image.new_from_memory(table.tobytes(), len(colors) * 256, 1, 4, "uchar")
+
+
+def field_image(scales, land: Image) -> Image:
+    """Scale the isoseismal field to the map and colour it, it is only kept over land.
+
+    The scales are interpolated before colouring, so the bands get smooth
+    edges. Cells below scale 1 are transparent, the others take the colour
+    of their scale at `FIELD_ALPHA`.
+    """
+    field = Image.new_from_memory(scales.tobytes(), FIELD_SIZE, FIELD_SIZE, 1, "uchar")
+    field = land.ifthenelse(field.resize(MAP_SIZE / FIELD_SIZE, kernel="linear"), 0)
+
+    return field.maplut(FIELD_TABLE)
+
+
+def _field_table() -> Image:
+    """Build the RGBA lookup table of the intensity scales."""
+    table = bytearray(256 * 4)
+    for scale, color in INTENSITY_COLORS.items():
+        table[scale * 4:scale * 4 + 4] = bytes((*bytes.fromhex(color[1:]), FIELD_ALPHA))
+
+    return Image.new_from_memory(bytes(table), 256, 1, 4, "uchar")
+
+
+FIELD_TABLE = _field_table()
+
+
+RENDERERS: dict[str, type[LayeredRenderer]] = {
+    "layered": LayeredRenderer,
+    "mask": MaskRenderer,
+}
+
+
+def benchmark_renderers(repeat: int = BENCHMARK_REPEAT) -> dict[str, float]:
+    """Time one frame of a sample event, return the ms per frame.
+
+    `svg` rasterizes the whole document of `core.map.draw` in one pass,
+    the renderers are compared against it. Encoding is left out, it costs
+    the same for all of them. This blocks for a while and belongs in a
+    worker thread.
+    """
+    args = (BENCHMARK_INTENSITYS, BENCHMARK_EVENT, BENCHMARK_EVENT["id"], None, BENCHMARK_URL)
+    frames = {"svg": lambda: rasterize(draw(*args))}
+    for name, renderer_class in RENDERERS.items():
+        renderer = renderer_class()
+        renderer.setup()
+        frames[name] = lambda renderer=renderer: renderer.draw_image(*args).copy_memory()
+
+    return {
+        name: round(min(Timer(frame).repeat(repeat=repeat, number=1)) * 1000, 2)
+        for name, frame in frames.items()
+    }
@@ -0,0 +1,101 @@
+"""Gridded site amplification for Taiwan Real-time Earthquake Monitoring integration.
+
+The grid is a binary file of a fixed little-endian header followed by one
+uint8 code per cell, row by row from the south-west corner:
+
+    magic     4s   b"TRSA"
+    version   H    1
+    rows      H
+    cols      H
+    reserved  H
+    lat0      d    latitude of the center of the first cell
+    lon0      d    longitude of the center of the first cell
+    step      d    cell size in degrees
+    scale     d    factor of one code step
+
+A cell with code 0 has no data, the others have the site factor
+`code * scale`. The data is memory-mapped and only the cells which are
+sampled are read from disk.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+import struct
+
+import numpy as np
+
+SITE_GRID_PATH = Path(__file__).parent.parent / "assets" / "site_amplification.bin"
+SITE_GRID_HEADER = struct.Struct("<4sHHHHdddd")
+SITE_GRID_MAGIC = b"TRSA"
+SITE_GRID_SCALE = 0.02
+SITE_GRID_VERSION = 1
+
+
+class SiteGrid:
+    """A memory-mapped grid of site amplification factors on a regular lat/lon grid."""
+
+    __slots__ = ("codes", "lat0", "lon0", "scale", "step")
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the grid file, raise ValueError if it is not a site amplification grid."""
+        with open(path, "rb") as file:
+            header = file.read(SITE_GRID_HEADER.size)
+
+        if len(header) < SITE_GRID_HEADER.size:
+            raise ValueError(f"Truncated site grid header: {path}")
+
+        magic, version, rows, cols, _, self.lat0, self.lon0, self.step, self.scale = SITE_GRID_HEADER.unpack(header)
+        if magic != SITE_GRID_MAGIC or version != SITE_GRID_VERSION or self.step <= 0:
+            raise ValueError(f"Unsupported site grid: {path}")
+
+        self.codes = np.memmap(path, dtype=np.uint8, mode="r", offset=SITE_GRID_HEADER.size, shape=(rows, cols))
+
+    def sample(self, lat, lon) -> np.ndarray:
+        """Return the site factor of the nearest cell of every point in degrees.
+
+        Points outside the grid or on cells without data are NaN.
+        """
+        rows, cols = self.codes.shape
+        row = np.rint((np.asarray(lat, dtype=np.float64) - self.lat0) / self.step).astype(np.intp)
+        col = np.rint((np.asarray(lon, dtype=np.float64) - self.lon0) / self.step).astype(np.intp)
+        inside = (row >= 0) & (row < rows) & (col >= 0) & (col < cols)
+
+        codes = np.zeros(row.shape, dtype=np.uint8)
+        codes[inside] = self.codes[row[inside], col[inside]]
+
+        return np.where(codes > 0, codes * self.scale, np.nan)
+
+
+@lru_cache(maxsize=1)
+def site_grid(path: str | Path = SITE_GRID_PATH) -> SiteGrid | None:
+    """Return the site amplification grid, None if the file is absent or invalid.
+
+    The file is only mapped on first use.
+    """
+    try:
+        return SiteGrid(path)
+    except (OSError, ValueError):
+        return None
+
+
+def write_site_grid(
+    path: str | Path,
+    factors,
+    lat0: float,
+    lon0: float,
+    step: float,
+    scale: float = SITE_GRID_SCALE,
+) -> None:
+    """Write a grid of site factors, one row per latitude from the south, NaN cells have no data.
+
+    The factors are rounded to `scale` and clipped to the range of a code.
+    """
+    factors = np.asarray(factors, dtype=np.float64)
+    rows, cols = factors.shape
+    codes = np.where(np.isnan(factors), 0, np.clip(np.rint(np.nan_to_num(factors) / scale), 1, 255))
+
+    with open(path, "wb") as file:
+        file.write(SITE_GRID_HEADER.pack(SITE_GRID_MAGIC, SITE_GRID_VERSION, rows, cols, 0, lat0, lon0, step, scale))
+        file.write(codes.astype(np.uint8).tobytes())
@@ -0,0 +1,121 @@
+"""P and S wave travel times for Taiwan Real-time Earthquake Monitoring integration."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from .geo import COUNTY_TABLE, GeoTable
+
+# Layered velocity model: (depth of the layer top in km, Vp, Vs in km/s)
+# A simplified 1-D model of the Taiwan crust and upper mantle, the last
+# layer is a half-space.
+VELOCITY_MODEL = (
+    (0, 5.10, 2.94),
+    (4, 5.50, 3.18),
+    (9, 6.05, 3.49),
+    (13, 6.21, 3.59),
+    (17, 6.25, 3.61),
+    (25, 6.60, 3.81),
+    (30, 6.90, 3.98),
+    (35, 7.10, 4.10),
+    (50, 7.63, 4.41),
+    (70, 7.97, 4.60),
+    (90, 8.12, 4.69),
+    (110, 8.20, 4.73),
+    (140, 8.28, 4.78),
+    (170, 8.37, 4.83),
+    (200, 8.44, 4.87),
+)
+PHASES = {"P": 1, "S": 2}
+
+# Table grid in km
+DEPTH_STEP = 2
+DEPTH_MAX = 300
+DISTANCE_STEP = 2
+DISTANCE_MAX = 1000
+MIN_DEPTH = 0.1
+RAY_SAMPLES = 4000
+
+
+def first_arrivals(depth: float, distances: np.ndarray, phase: str = "S") -> np.ndarray:
+    """Return the first arrival times in seconds of a source at `depth` km.
+
+    The direct wave is shot upwards over the ray parameters up to grazing
+    incidence, the head waves run along every interface below the source
+    which is faster than all layers above it. Each distance takes the
+    earliest of them.
+    """
+    depth = max(depth, MIN_DEPTH)
+    tops = np.array([layer[0] for layer in VELOCITY_MODEL], dtype=np.float64)
+    velocity = np.array([layer[PHASES[phase]] for layer in VELOCITY_MODEL], dtype=np.float64)
+    bottoms = np.append(tops[1:], np.inf)
+
+    # Thickness of every layer above the source, then counted again down to each interface
+    above = np.clip(np.minimum(bottoms, depth) - tops, 0, None)
+    below = np.clip(bottoms - np.maximum(tops, depth), 0, None)
+
+    # Direct wave
+    thickness, upper = above[above > 0], velocity[above > 0]
+    p = np.sin(np.linspace(0, np.pi / 2, RAY_SAMPLES, endpoint=False))[:, np.newaxis] / upper.max()
+    cosines = np.sqrt(1 - (p * upper) ** 2)
+    x = (thickness * p * upper / cosines).sum(axis=1)
+    t = (thickness / (upper * cosines)).sum(axis=1)
+    times = np.interp(distances, x, t, right=np.inf)
+
+    # Head waves
+    for layer in range(1, len(VELOCITY_MODEL)):
+        if tops[layer] < depth or velocity[layer] <= velocity[:layer].max():
+            continue
+
+        path = above[:layer] + below[:layer]
+        p = 1 / velocity[layer]
+        cosines = np.sqrt(1 - (p * velocity[:layer]) ** 2)
+        critical = (path * p * velocity[:layer] / cosines).sum()
+        intercept = (path * cosines / velocity[:layer]).sum()
+        times = np.where(distances >= critical, np.minimum(times, distances * p + intercept), times)
+
+    return times
+
+
+@lru_cache(maxsize=len(PHASES))
+def travel_time_table(phase: str = "S") -> np.ndarray:
+    """Return the first arrival times of a phase, one row per depth and one column per distance.
+
+    The table is computed on first use, the rows are `DEPTH_STEP` km and
+    the columns `DISTANCE_STEP` km apart.
+    """
+    distances = np.arange(0, DISTANCE_MAX + DISTANCE_STEP, DISTANCE_STEP, dtype=np.float64)
+    table = np.stack([
+        first_arrivals(depth, distances, phase) for depth in range(0, DEPTH_MAX + DEPTH_STEP, DEPTH_STEP)
+    ])
+    table.setflags(write=False)
+
+    return table
+
+
+def travel_times(depth: float, distances, phase: str = "S") -> np.ndarray:
+    """Return the travel times in seconds by bilinear interpolation of the table.
+
+    Depths are clamped to the table, distances beyond it are extrapolated
+    with the slope of the last column.
+    """
+    table = travel_time_table(phase)
+    rows, columns = table.shape
+
+    row = np.clip(depth / DEPTH_STEP, 0, rows - 1)
+    row0 = min(int(row), rows - 2)
+    column = np.asarray(distances, dtype=np.float64) / DISTANCE_STEP
+    column0 = np.clip(column.astype(np.intp), 0, columns - 2)
+
+    # Interpolate the two depth rows first, then along the distance
+    times = table[row0] + (table[row0 + 1] - table[row0]) * (row - row0)
+    return times[column0] + (times[column0 + 1] - times[column0]) * (column - column0)
+
+
+def arrival_times(eq_data: dict, table: GeoTable = COUNTY_TABLE, phase: str = "S") -> np.ndarray:
+    """Return the arrival timestamps in ms at every point of the table, derived from `eq.time`."""
+    distances = table.distances(eq_data["lat"], eq_data["lon"])
+
+    return eq_data["time"] + travel_times(eq_data.get("depth") or 0, distances, phase) * 1000
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import islice
 import logging
 import re
 from typing import TYPE_CHECKING, Any
@@ -10,8 +13,19 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import ATTR_COUNTY, COUNTY_TOWN, ZIP3_TOWN
-from .core.earthquake import intensity_to_text
+from .const import (
+    ATTR_COUNTY,
+    CONF_EEW_HISTORY,
+    CONF_GROUND_MOTION_MODEL,
+    CONF_REPORT_HISTORY,
+    DEDUP_INDEX_SIZE,
+    DEFAULT_EEW_HISTORY,
+    DEFAULT_GROUND_MOTION_MODEL,
+    DEFAULT_REPORT_HISTORY,
+)
+from .core.earthquake import estimate_town_intensity, intensity_to_text
+from .models import BoundedSet
+from .zip3 import zip3_to_county, zip3_to_town
 
 if TYPE_CHECKING:
     from .runtime import Trem2RuntimeData
@@ -21,6 +35,11 @@ _LOGGER = logging.getLogger(__name__)
 type Trem2ConfigEntry = ConfigEntry[Trem2RuntimeData]
 
 
+def _history(items: Iterable[dict[str, Any]], depth: int) -> deque[dict[str, Any]]:
+    """Return a ring buffer of the newest `depth` items, the newest first."""
+    return deque(islice(items, depth), maxlen=depth)
+
+
 class Trem2DataClient:
     """Defines stored for TREM2."""
 
@@ -33,6 +52,15 @@ class Trem2DataClient:
         self.hass = hass
         self.config_entry = config_entry
 
+        # History depth, the caches are ring buffers which evict the oldest entry
+        self.eew_history: int = config_entry.options.get(CONF_EEW_HISTORY, DEFAULT_EEW_HISTORY)
+        self.report_history: int = config_entry.options.get(CONF_REPORT_HISTORY, DEFAULT_REPORT_HISTORY)
+
+        # Dedup indexes, kept alongside the caches and remembering more than them
+        self.eew_index = BoundedSet(DEDUP_INDEX_SIZE)
+        self.eew_ids = BoundedSet(DEDUP_INDEX_SIZE)
+        self.report_index = BoundedSet(DEDUP_INDEX_SIZE)
+
     async def load_recent_data(self, data: dict[str, Any] | None = None) -> bool:
         """Perform recent data processing."""
         default_data = {
@@ -44,17 +72,15 @@ class Trem2DataClient:
         }
         coordinator_data = self.coordinator.data
 
-        # Load recent data from stored
-        store_eew = self.sotre_handler.get_store("recent")
-        store_data = await store_eew.async_load()
-        coordinator_data.setdefault("recent", store_data or default_data)
+        # Hydrate recent data from the stored data loaded at setup
+        if "recent" not in coordinator_data:
+            coordinator_data["recent"] = self.sotre_handler.get_data("recent") or default_data
+            self._restore_recent(coordinator_data["recent"])
 
         # Check earthquake data if not None
         if data:
-            cache: list[dict[str, Any]] = coordinator_data["recent"]["cache"]
-            seen = {(d["id"], d.get("serial", "")) for d in cache}
             key = (data["id"], data.get("serial", ""))
-            if key in seen:
+            if key in self.eew_index:
                 return False
 
             # Stored earthquake data to runtime data
@@ -65,12 +91,10 @@ class Trem2DataClient:
                 coordinator_data["recent"]["earthquake"] = data
 
             # Stored to earthquake cache
-            new_cache = cache.copy()
-            new_cache.insert(0, data)
-            coordinator_data["recent"]["cache"] = new_cache[:10]
-            await store_eew.async_save(
-                coordinator_data["recent"],
-            )
+            self.eew_index.add(key)
+            self.eew_ids.add(data["id"])
+            coordinator_data["recent"]["cache"].appendleft(data)
+            self.sotre_handler.async_delay_save("recent")
 
             # Abort earthquake simulating and Update coordinator data
             coordinator_data["recent"]["simulating"] = {}
@@ -88,10 +112,10 @@ class Trem2DataClient:
         }
         coordinator_data = self.coordinator.data
 
-        # Load recent data from stored
-        store_report = self.sotre_handler.get_store("report")
-        store_data = await store_report.async_load()
-        coordinator_data.setdefault("report", store_data or default_data)
+        # Hydrate report data from the stored data loaded at setup
+        if "report" not in coordinator_data:
+            coordinator_data["report"] = self.sotre_handler.get_data("report") or default_data
+            self._restore_report(coordinator_data["report"])
 
         # Check earthquake data if not None
         if data:
@@ -107,9 +131,7 @@ class Trem2DataClient:
             data.setdefault("author", "Unknown")
 
             # Check earthquake data if not exist
-            cache: list[dict[str, Any]] = coordinator_data["report"]["cache"]
-            seen = {d["id"] for d in cache}
-            if data["id"] in seen:
+            if data["id"] in self.report_index:
                 return False
 
             # Stored earthquake data to runtime data
@@ -117,12 +139,9 @@ class Trem2DataClient:
             coordinator_data["report"]["recent"] = data
 
             # Stored to report cache
-            new_cache = cache.copy()
-            new_cache.insert(0, data)
-            coordinator_data["report"]["cache"] = new_cache[:5]
-            await store_report.async_save(
-                coordinator_data["report"],
-            )
+            self.report_index.add(data["id"])
+            coordinator_data["report"]["cache"].appendleft(data)
+            self.sotre_handler.async_delay_save("report")
 
             # Update coordinator data
             coordinator_data["recent"]["simulating"] = {}
@@ -137,12 +156,13 @@ class Trem2DataClient:
         eew_data: dict = coordinator_data["recent"]["earthquake"]
         simulate_data: dict = coordinator_data["recent"]["simulating"]
         report_data: dict = coordinator_data["report"]["recent"]
-        report_cache: list = coordinator_data["report"]["cache"]
+        report_cache: deque = coordinator_data["report"]["cache"]
         intensity_data: dict = coordinator_data["recent"]["intensity"]
 
         # Return simulate data if simulating
         if simulate_data:
             simulate_data["intensity"], simulate_data["list"] = await self.load_intensitys(simulate_data)
+            simulate_data["estimated_list"] = await self.load_estimated_list(simulate_data)
             return simulate_data
 
         known_intensity = [report["trem"] for report in report_cache if "trem" in report]
@@ -160,6 +180,7 @@ class Trem2DataClient:
                     intensitys["author"] = intensity_data.get("author")
                     intensitys["max"] = intensity_data.get("max")
 
+                intensitys["estimated_list"] = await self.load_estimated_list(intensitys)
                 return intensitys
             case (_, report_id) if report_id:
                 for data in coordinator_data["report"]["cache"]:
@@ -180,6 +201,7 @@ class Trem2DataClient:
 
         if "intensity" not in eew_data or "list" not in eew_data:
             eew_data["intensity"], eew_data["list"] = await self.load_intensitys(eew_data, report_data)
+            eew_data["estimated_list"] = await self.load_estimated_list(eew_data)
 
         return eew_data
 
@@ -236,46 +258,33 @@ class Trem2DataClient:
 
         return intensity, lists
 
+    async def load_estimated_list(self, eew: dict[str, Any]) -> dict:
+        """Estimate every township if nothing was observed.
+
+        The estimate has the same format as the observed `list` but is kept
+        apart from it, so a prediction is never mistaken for an observation.
+        """
+        if eew.get("list") or not eew.get("eq"):
+            return {}
+
+        model = self.config_entry.options.get(CONF_GROUND_MOTION_MODEL, DEFAULT_GROUND_MOTION_MODEL)
+
+        return await self.convert_zip3_town({"area": estimate_town_intensity(eew["eq"], model)})
+
     async def convert_zip3_county(self, intensitys: dict[str, Any]) -> dict:  # noqa: PLR6301
         """Convert ZIP Code to county id."""
-        result = {}
-
         if "area" not in intensitys:
             return {}
 
-        # Each intensity area
-        intensity_area: dict[str, Any] = intensitys["area"]
-        for i, j in intensity_area.items():
-            # Each township
-            for k in j:
-                # Each county
-                for county_id, (zip_start, zip_end) in COUNTY_TOWN.items():
-                    # If township in county
-                    if zip_start <= k <= zip_end:
-                        # Only update if new intensity is higher
-                        if county_id not in result or result[county_id] < int(i):
-                            result[county_id] = int(i)
-                        break
-
-        return result
+        # One pass over the townships, keeping the highest intensity of each county
+        return zip3_to_county(intensitys["area"])
 
     async def convert_zip3_town(self, intensitys) -> dict:  # noqa: PLR6301
         """Convert ZIP Code to Township name."""
-        result = {}
-
         if "area" not in intensitys:
             return {}
 
-        # Each intensity area
-        intensity_area: dict[str, Any] = intensitys["area"]
-        for i, j in intensity_area.items():
-            town = []
-            for k in j:
-                if k in ZIP3_TOWN:
-                    town.insert(0, ZIP3_TOWN[k])
-            result[intensity_to_text(int(i))] = town
-
-        return result
+        return {intensity_to_text(i): town for i, town in zip3_to_town(intensitys["area"]).items()}
 
     async def fetch_report(self):
         """Fetch report data detail."""
@@ -297,13 +306,40 @@ class Trem2DataClient:
             data.setdefault("author", "ExpTechTW")
 
         if report_data:
+            # Keep the older history behind the fetched reports
+            fetched = {data["id"] for data in report_data}
+            cache: deque = coordinator_data["report"]["cache"]
             coordinator_data["report"]["recent"] = report_data[0]
-            coordinator_data["report"]["cache"] = report_data
+            coordinator_data["report"]["cache"] = _history(
+                [*report_data, *(data for data in cache if data["id"] not in fetched)],
+                self.report_history,
+            )
             coordinator_data["report"]["fetch_time"] = datetime.now().timestamp()
+            for data in reversed(report_data):
+                self.report_index.add(data["id"])
+            self.sotre_handler.async_delay_save("report")
 
             # Update coordinator data
             self.coordinator.async_set_updated_data(coordinator_data)
 
+    def _restore_recent(self, recent: dict[str, Any]) -> None:
+        """Restore the EEW history and dedup index from the store, older stores rebuild it from the cache."""
+        recent["cache"] = _history(recent["cache"], self.eew_history)
+        keys = recent.pop("seen", None) or [(d["id"], d.get("serial", "")) for d in reversed(recent["cache"])]
+        for key in keys:
+            self.eew_index.add(tuple(key))
+            self.eew_ids.add(key[0])
+
+        self.sotre_handler.register_extra("recent", "seen", self.eew_index.to_list)
+
+    def _restore_report(self, report: dict[str, Any]) -> None:
+        """Restore the report history and dedup index from the store, older stores rebuild it from the cache."""
+        report["cache"] = _history(report["cache"], self.report_history)
+        for report_id in report.pop("seen", None) or [d["id"] for d in reversed(report["cache"])]:
+            self.report_index.add(report_id)
+
+        self.sotre_handler.register_extra("report", "seen", self.report_index.to_list)
+
     async def api_node(self):
         """Return current connection mode."""
         if self.web_socket:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -11,6 +12,10 @@ from homeassistant.const import CONF_API_TOKEN, CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
+from .core.earthquake import estimate_cache_info
+from .core.gmm import benchmark_models
+from .core.render import benchmark_renderers
+
 if TYPE_CHECKING:
     from .runtime import Trem2RuntimeData
 
@@ -24,6 +29,18 @@ TO_REDACT = [
 type Trem2ConfigEntry = ConfigEntry[Trem2RuntimeData]
 
 
+@cache
+def _benchmark_models() -> dict[str, dict[str, float]]:
+    """Time the ground motion models once, the timings are reused by later downloads."""
+    return benchmark_models()
+
+
+@cache
+def _benchmark_renderers() -> dict[str, float]:
+    """Time one frame of the full SVG and of each renderer once, the timings are reused by later downloads."""
+    return benchmark_renderers()
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,
     entry: Trem2ConfigEntry,
@@ -56,9 +73,13 @@ async def _async_get_diagnostics(hass: HomeAssistant, config_entry: Trem2ConfigE
         if coordinator:
             diag_data["last_exception"] = repr(coordinator.last_exception)
             diag_data["server_status"] = await coordinator.data_client.server_status()
-            diag_data["recent"] = coordinator.data["recent"]
-            diag_data["report"] = coordinator.data["report"]
+            diag_data["recent"] = {**coordinator.data["recent"], "cache": list(coordinator.data["recent"]["cache"])}
+            diag_data["report"] = {**coordinator.data["report"], "cache": list(coordinator.data["report"]["cache"])}
             diag_data["update_interval"] = runtime_data.update_interval.total_seconds()
+            diag_data["storage"] = runtime_data.sotre_handler.stats()
+            diag_data["estimate_cache"] = estimate_cache_info()._asdict()
+            diag_data["ground_motion_models"] = await hass.async_add_executor_job(_benchmark_models)
+            diag_data["renderers"] = await hass.async_add_executor_job(_benchmark_renderers)
     except (AttributeError, KeyError, RuntimeError) as e:
         diag_data["error"] = f"{type(e).__name__}: {e!r}"
 
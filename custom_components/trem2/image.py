@@ -3,26 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pyvips import Image
 import voluptuous as vol
 
 from homeassistant.components.image import ImageEntity, ImageEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION, CONF_EMAIL, CONF_FILENAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, async_get_current_platform
 from homeassistant.util import dt as dt_util
 
-from .const import ATTR_COUNTY, ATTR_ID, ATTRIBUTION, DOMAIN, MANUFACTURER, OFFICIAL_URL, __version__
+from .const import (
+    ATTR_COUNTY,
+    ATTR_DROPPED_FRAMES,
+    ATTR_ID,
+    ATTR_RENDER_QUEUE,
+    ATTRIBUTION,
+    CONF_GROUND_MOTION_MODEL,
+    CONF_IMAGE_EFFORT,
+    CONF_IMAGE_FORMAT,
+    CONF_IMAGE_SIZES,
+    CONF_ISOSEISMAL_FIELD,
+    CONF_RENDERER,
+    DEFAULT_GROUND_MOTION_MODEL,
+    DEFAULT_IMAGE_EFFORT,
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_IMAGE_SIZES,
+    DEFAULT_RENDERER,
+    DOMAIN,
+    IMAGE_CACHE_BYTES,
+    MANUFACTURER,
+    OFFICIAL_URL,
+    __version__,
+)
 from .core.earthquake import get_calculate_intensity, intensity_to_text, round_intensity
-from .core.map import draw as draw_isoseismal_map
-from .runtime import Trem2ImageData
+from .core.map import generate_qr_code
+from .core.render import RENDERERS, LayeredRenderer, parse_image_sizes
+from .models import BytesLRUCache
+from .runtime import Trem2ImageData, Trem2RenderJob
 
 if TYPE_CHECKING:
     from .runtime import Trem2RuntimeData
@@ -53,6 +80,9 @@ async def async_setup_entry(
             entities.append(image_entity)
             hass.data[DOMAIN][config_entry.entry_id][entity.key] = image_entity
 
+            # Downscaled copies for small clients
+            entities.extend(MonitoringVariantImage(image_entity, size) for size in image_entity.renderer.sizes)
+
     async_add_entities(entities, update_before_add=True)
 
     # Register services for the binary sensor
@@ -70,7 +100,7 @@ async def async_setup_entry(
 
 
 class MonitoringImage(ImageEntity):
-    """Representation of an image entity for displaying a custom SVG image as PNG."""
+    """Representation of an image entity for displaying a custom SVG image as PNG, WebP or JPEG."""
 
     def __init__(
         self,
@@ -93,11 +123,30 @@ class MonitoringImage(ImageEntity):
         self.coordinator = config_entry.runtime_data.coordinator
         self.data = Trem2ImageData()
         self.entity_description = description
+        renderer = RENDERERS.get(config_entry.options.get(CONF_RENDERER, DEFAULT_RENDERER), LayeredRenderer)
+        self.renderer = renderer(
+            config_entry.options.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT),
+            config_entry.options.get(CONF_IMAGE_EFFORT, DEFAULT_IMAGE_EFFORT),
+            parse_image_sizes(config_entry.options.get(CONF_IMAGE_SIZES, DEFAULT_IMAGE_SIZES)),
+            config_entry.options.get(CONF_ISOSEISMAL_FIELD, False),
+            config_entry.options.get(CONF_GROUND_MOTION_MODEL, DEFAULT_GROUND_MOTION_MODEL),
+        )
+        self.variant_entities: list[MonitoringVariantImage] = []
+        self.image_cache = BytesLRUCache(IMAGE_CACHE_BYTES)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{DOMAIN}_render")
+        self._render_task: asyncio.Task | None = None
+        self._render_job: Trem2RenderJob | None = None
+        self._pending_job: Trem2RenderJob | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
         await super().async_added_to_hass()
 
+        # Rasterize the static map layers and the default QR code
+        loop = self.hass.loop
+        await loop.run_in_executor(self._executor, self.renderer.setup)
+        await loop.run_in_executor(self._executor, generate_qr_code, *self._qr_code_source({}, None))
+
         def _schedule_update_callback() -> None:
             self.hass.async_create_task(self._update_callback())
 
@@ -109,6 +158,11 @@ class MonitoringImage(ImageEntity):
 
     async def async_will_remove_from_hass(self):
         """Unload when this Entity has been remove from HA."""
+        self._pending_job = None
+        if self._render_task:
+            self._render_task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
         await super().async_will_remove_from_hass()
 
     async def async_image(self) -> bytes | None:
@@ -123,7 +177,7 @@ class MonitoringImage(ImageEntity):
     @property
     def content_type(self):
         """Return the content type of the image."""
-        return "image/png"
+        return self.renderer.content_type
 
     @property
     def name(self):
@@ -149,8 +203,25 @@ class MonitoringImage(ImageEntity):
         for k, v in self.data.attr_value.items():
             self.data.attributes[k] = v
 
+        self.data.attributes[ATTR_RENDER_QUEUE] = self.render_queue_depth
+        self.data.attributes[ATTR_DROPPED_FRAMES] = self.data.dropped_frames
+
         return self.data.attributes
 
+    @property
+    def render_queue_depth(self) -> int:
+        """Return the number of renders in flight or waiting."""
+        return int(self._render_job is not None) + int(self._pending_job is not None)
+
+    @property
+    def latest_fingerprint(self) -> str | None:
+        """Return the fingerprint of the newest map, the waiting one, the rendering one or the shown one."""
+        job = self._pending_job or self._render_job
+        if job is not None:
+            return job.fingerprint
+
+        return self.data.fingerprint
+
     async def _update_callback(self):
         """Handle updated data from the coordinator."""
         if not self.coordinator.last_update_success:
@@ -160,29 +231,40 @@ class MonitoringImage(ImageEntity):
             # Get the latest earthquake data
             report_id = getattr(self.config_entry.runtime_data, "selected_option", None)
             eew = await self.coordinator.data_client.load_eew_data(report_id)
-
-            # Check state change
-            if self.data.image_id == eew.get("id"):
-                return
+            eq_id = eew.get("id", self.data.image_id)
+            intensitys = self.data.intensitys
+            attr_value = self.data.attr_value
 
             # Calculate the intensity
             match eew:
                 case {"intensity": intensitys}:
-                    self.data.intensitys = intensitys
-                    self.data.attr_value = eew["list"]
+                    attr_value = eew["list"]
 
                 case {"eq": eq_info}:
-                    self.data.intensitys = get_calculate_intensity(eq_info)
-                    self.data.attr_value = {
+                    intensitys = get_calculate_intensity(eq_info, self.renderer.model)
+                    attr_value = {
                         ATTR_COUNTY.get(k, k): intensity_to_text(v)
-                        for k, v in self.data.intensitys.items()
+                        for k, v in intensitys.items()
                         if round_intensity(v) > 0
                     }
 
-            # Draw map
-            await self._drawing_map(
-                eew,
-                eew.get("id", self.data.image_id),
+            # Check state change, a map which is already rendering or waiting is not queued again
+            url, bg_path = self._qr_code_source(eew, eq_id)
+            fingerprint = _image_fingerprint(eew, intensitys, url)
+            if self.latest_fingerprint == fingerprint:
+                return
+
+            # Draw map, the data is copied since the coordinator keeps updating it
+            self._schedule_render(
+                Trem2RenderJob(
+                    eew=deepcopy(eew),
+                    eq_id=eq_id,
+                    url=url,
+                    bg_path=bg_path,
+                    fingerprint=fingerprint,
+                    intensitys=dict(intensitys),
+                    attr_value=dict(attr_value),
+                )
             )
         except TypeError as ex:
             _LOGGER.error("TypeError occurred while processing earthquake data: %s", ex)
@@ -193,49 +275,88 @@ class MonitoringImage(ImageEntity):
                 exc_info=ex,
             )
 
-        # Update the attributes
-        self.async_write_ha_state()
+    def _schedule_render(self, job: Trem2RenderJob) -> None:
+        """Render the job, or keep it as the next one while a render is in flight.
 
-    async def _drawing_map(self, eew, eq_id):
-        """Draw Monitoring Image."""
-        assets_path = f"custom_components/{DOMAIN}/assets"
+        Only one render runs at a time and only the newest waiting job is kept,
+        a waiting job replaced by a newer one is counted as a dropped frame.
+        """
+        if self._render_task is not None and not self._render_task.done():
+            if self._pending_job is not None:
+                self.data.dropped_frames += 1
+            self._pending_job = job
+            return
 
-        # QR Code data
-        bg_path = self.hass.config.path(f"{assets_path}/brand.svg")
-        url = OFFICIAL_URL
-        if "md5" in eew:
-            bg_path = self.hass.config.path(f"{assets_path}/cwa_logo.svg")
-            url = f"https://www.cwa.gov.tw/V8/C/E/EQ/EQ{eq_id}.html"
-
-        # Draw the isoseismal map
-        svg_cont = draw_isoseismal_map(
-            self.data.intensitys,
-            eew,
-            eq_id,
-            bg_path,
-            url,
+        self._render_job = job
+        self._render_task = self.hass.async_create_background_task(
+            self._render_loop(job),
+            f"{DOMAIN}_{self.entity_description.key}_render",
         )
 
-        # Remove BOM and decode the SVG data
-        svg_byte = svg_cont.lstrip().encode("utf-8").lstrip(b"\xef\xbb\xbf")
-
-        # Convert the SVG bytes to PNG using pyvips
-        svg_data: Image = await asyncio.to_thread(  # type: ignore  # noqa: PGH003
-            Image.new_from_buffer,
-            svg_byte,
-            "",
-        )
+    async def _render_loop(self, job: Trem2RenderJob | None) -> None:
+        """Render jobs until no newer job is waiting.
+
+        A job which fails to render is logged and skipped, the loop always
+        moves on to the waiting job so one bad payload cannot stop rendering.
+        """
+        while job is not None:
+            self._render_job = job
+            try:
+                if self.data.fingerprint != job.fingerprint:
+                    await self._drawing_map(job)
+            except Exception as ex:
+                _LOGGER.error("Failed to render the monitoring image of %s: %s", job.eq_id, ex, exc_info=ex)
+            finally:
+                job, self._pending_job = self._pending_job, None
+                self._render_job = job
+
+            # Update the attributes
+            self.async_write_ha_state()
+            for variant_entity in self.variant_entities:
+                variant_entity.async_image_updated()
+
+    async def _drawing_map(self, job: Trem2RenderJob) -> None:
+        """Draw Monitoring Image."""
+        image = self.image_cache.get(job.fingerprint)
+        variants = {size: self.image_cache.get(f"{job.fingerprint}@{size}") for size in self.renderer.sizes}
+
+        if image is None or None in variants.values():
+            # Draw, rasterize and encode the map in the render worker
+            image, variants = await self.hass.loop.run_in_executor(
+                self._executor,
+                self.renderer.render,
+                job.intensitys,
+                job.eew,
+                job.eq_id,
+                job.bg_path,
+                job.url,
+            )
 
-        # Storing the PNG to image
-        self.data.image = await asyncio.to_thread(  # type: ignore  # noqa: PGH003
-            svg_data.write_to_buffer,
-            ".png",
-        )
+            # Keep it for switching back to this map
+            self.image_cache.put(job.fingerprint, image)
+            for size, variant in variants.items():
+                self.image_cache.put(f"{job.fingerprint}@{size}", variant)
+
+        # Swap in the new image and its attributes at once
+        self.data.image = image
+        self.data.variants = variants
+        self.data.fingerprint = job.fingerprint
+        self.data.intensitys = job.intensitys
+        self.data.attr_value = {**job.attr_value, ATTR_ID: job.eq_id}
+        self.data.image_id = job.eq_id
         self._attr_image_last_updated = dt_util.utcnow()
 
-        # Update the _image_id
-        self.data.image_id = eq_id
-        self.data.attr_value[ATTR_ID] = eq_id
+    def _qr_code_source(self, eew: dict, eq_id) -> tuple[str, str]:
+        """Return the QR code url and its background, CWA reports link to the report page."""
+        assets_path = f"custom_components/{DOMAIN}/assets"
+
+        if "md5" in eew:
+            return (
+                f"https://www.cwa.gov.tw/V8/C/E/EQ/EQ{eq_id}.html",
+                self.hass.config.path(f"{assets_path}/cwa_logo.svg"),
+            )
+
+        return OFFICIAL_URL, self.hass.config.path(f"{assets_path}/brand.svg")
 
     async def async_handle_save_image(self, **kwargs) -> None:
         """Handle the save image service."""
@@ -256,8 +377,8 @@ class MonitoringImage(ImageEntity):
                 )
             )
 
-            if filepath.suffix != ".png":
-                filepath = filepath.with_suffix(".png")
+            if filepath.suffix != self.renderer.suffix:
+                filepath = filepath.with_suffix(self.renderer.suffix)
 
             filepath.parent.mkdir(parents=True, exist_ok=True)
             if not self.hass.config.is_allowed_path(str(filepath)):
@@ -282,3 +403,72 @@ class MonitoringImage(ImageEntity):
                 "folder": str(filepath.parent),
             },
         )
+
+
+class MonitoringVariantImage(ImageEntity):
+    """Representation of a downscaled copy of the monitoring image."""
+
+    def __init__(self, monitoring: MonitoringImage, size: int) -> None:
+        """Initialize the image entity."""
+        super().__init__(monitoring.hass)
+
+        self._attr_device_info = monitoring.device_info
+        self.monitoring = monitoring
+        self.size = size
+
+    async def async_added_to_hass(self) -> None:
+        """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
+
+        self.monitoring.variant_entities.append(self)
+        self.async_on_remove(lambda: self.monitoring.variant_entities.remove(self))
+        self._attr_image_last_updated = self.monitoring.image_last_updated
+
+    async def async_image(self) -> bytes | None:
+        """Return the downscaled monitoring image."""
+        return self.monitoring.data.variants.get(self.size)
+
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self.monitoring.available
+
+    @property
+    def content_type(self):
+        """Return the content type of the image."""
+        return self.monitoring.content_type
+
+    @property
+    def name(self):
+        """Return the name of the image."""
+        return f"{self.monitoring.name} {self.size}px"
+
+    @property
+    def unique_id(self):
+        """Return the unique id of the image."""
+        return f"{self.monitoring.unique_id}_{self.size}"
+
+    @callback
+    def async_image_updated(self) -> None:
+        """Follow the monitoring image after it is redrawn."""
+        self._attr_image_last_updated = self.monitoring.image_last_updated
+        self.async_write_ha_state()
+
+
+def _image_fingerprint(eew: dict, intensitys: dict, url: str) -> str:
+    """Return a digest of everything drawn on the monitoring image."""
+    eq: dict = eew.get("eq", {})
+    content = json.dumps(
+        [
+            eew.get("id"),
+            eew.get("serial"),
+            intensitys,
+            eew.get("author", eq.get("author")),
+            url,
+            eq,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -141,3 +143,79 @@ class DictKeyExclusionCycler:
         # This part should not be reached if the check at the start is correct,
         # but serves as a safeguard.
         return (None, None)
+
+
+class BytesLRUCache:
+    """A least recently used cache of bytes, bounded by the total size of its values."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache with a byte budget."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._data)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value and mark it as recently used."""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Cache a value, evicting the least recently used ones over the budget."""
+        if len(value) > self.max_bytes:
+            return
+
+        old_value = self._data.pop(key, None)
+        if old_value is not None:
+            self.size -= len(old_value)
+
+        self._data[key] = value
+        self.size += len(value)
+
+        while self.size > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class BoundedSet:
+    """An insertion ordered set bounded by its length, the oldest keys are evicted first."""
+
+    def __init__(self, maxlen: int, keys: Iterable[Hashable] = ()) -> None:
+        """Initialize the set with the keys from oldest to newest."""
+        self.maxlen = maxlen
+        self._data: OrderedDict[Hashable, None] = OrderedDict()
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if the key is in the set."""
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the keys from oldest to newest."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._data)
+
+    def add(self, key: Hashable) -> bool:
+        """Add a key, evicting the oldest ones over the bound. Return False if it was already present."""
+        if key in self._data:
+            return False
+
+        self._data[key] = None
+        while len(self._data) > self.maxlen:
+            self._data.popitem(last=False)
+
+        return True
+
+    def to_list(self) -> list:
+        """Return the keys from oldest to newest, for storage."""
+        return list(self._data)
@@ -40,11 +40,27 @@ class Trem2ImageData:
 
     image_id: str | None = None
     image: bytes | None = None
+    fingerprint: str | None = None
+    dropped_frames: int = 0
+    variants: dict[int, bytes] = field(default_factory=dict)
     attributes = {}
     attr_value = {}
     intensitys = {}
 
 
+@dataclass(kw_only=True, slots=True)
+class Trem2RenderJob:
+    """A snapshot of the data drawn on one monitoring image."""
+
+    eew: dict
+    eq_id: str | None
+    url: str
+    bg_path: str
+    fingerprint: str
+    intensitys: dict
+    attr_value: dict
+
+
 @dataclass
 class WebSocketState:
     """WebSocket State and Task for runtime data."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
@@ -15,20 +16,36 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     CONF_EMAIL,
     EntityCategory,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import slugify
+import numpy as np
 
 from .const import (
+    ARRIVAL_WINDOW,
     ATTR_AUTHOR,
+    ATTR_COUNTY_ARRIVAL,
     ATTR_DEPTH,
+    ATTR_ESTIMATED_LIST,
     ATTR_ID,
+    ATTR_INTENSITY,
     ATTR_LIST,
     ATTR_MAG,
+    ATTR_P_ARRIVAL,
+    ATTR_S_ARRIVAL,
+    ATTR_SITE_EFFECT,
     ATTR_TIME,
     ATTRIBUTION,
     BASE_INTERVAL,
+    CONF_GROUND_MOTION_MODEL,
+    CONF_SITES,
+    COUNTDOWN_ICON,
+    COUNTDOWN_INTERVAL,
+    DEFAULT_GROUND_MOTION_MODEL,
     DEFAULT_ICON,
     DOMAIN,
     MANUFACTURER,
@@ -37,6 +54,9 @@ from .const import (
     TZ_UTC,
     __version__,
 )
+from .core.earthquake import estimate_event, intensity_to_text, round_intensitys
+from .core.geo import COUNTY_TABLE, GeoTable, parse_sites, site_table
+from .core.traveltime import arrival_times, travel_time_table
 
 if TYPE_CHECKING:
     from .runtime import Trem2RuntimeData
@@ -75,9 +95,228 @@ async def async_setup_entry(
             entities.append(sensor_entity)
             hass.data[DOMAIN][config_entry.entry_id][entity.key] = sensor_entity
 
+    sites = parse_sites(config_entry.options.get(CONF_SITES), key=slugify)
+    if sites:
+        site_sensors = [SiteIntensitySensor(config_entry, site) for site in sites]
+        estimator = SiteEstimator(config_entry, site_sensors)
+        config_entry.async_on_unload(estimator.coordinator.async_add_listener(estimator.async_update))
+        entities.extend(site_sensors)
+
+    # Build the travel time tables before the first serial needs them
+    await hass.async_add_executor_job(travel_time_table, "P")
+    await hass.async_add_executor_job(travel_time_table, "S")
+
+    home = ("Home", hass.config.latitude, hass.config.longitude, None)
+    countdown_sensors = [
+        CountdownSensor(config_entry, site, counties=site is home)
+        for site in (home, *(site for site in sites if slugify(site[0]) != "home"))
+    ]
+    countdown = ArrivalCountdown(hass, config_entry, countdown_sensors)
+    config_entry.async_on_unload(countdown.coordinator.async_add_listener(countdown.async_update))
+    config_entry.async_on_unload(countdown.async_stop)
+    entities.extend(countdown_sensors)
+
     async_add_entities(entities, update_before_add=True)
 
 
+def _latest_eew(coordinator, table: GeoTable) -> dict:
+    """Return the simulating or the latest earthquake early warning.
+
+    The latest warning is kept across restarts, it is only returned while
+    its arrival window is open, until `ARRIVAL_WINDOW` after the S wave
+    reached the farthest point of the table.
+    """
+    recent: dict = coordinator.data.get("recent", {})
+    if simulating := recent.get("simulating"):
+        return simulating
+
+    eew: dict = recent.get("earthquake") or {}
+    eq: dict = eew.get("eq") or {}
+    if None in (eq.get("lat"), eq.get("lon"), eq.get("time")):
+        return {}
+
+    closing = arrival_times(eq, table, "S").max() + ARRIVAL_WINDOW.total_seconds() * 1000
+
+    return eew if closing > time.time() * 1000 else {}
+
+
+class ArrivalCountdown:
+    """Count down the S wave arrival at home and at the configured sites.
+
+    The P and S arrival timestamps are derived from the travel time tables
+    once per serial. The countdown then ticks locally every second without
+    coordinator refreshes, each tick is a subtraction and only sensors
+    whose remaining seconds changed are written. The timer stops once
+    the S wave has passed every site.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: Trem2ConfigEntry, sensors: list[CountdownSensor]) -> None:
+        """Initialize the countdown."""
+        self.hass = hass
+        self.coordinator = config_entry.runtime_data.coordinator
+        self.sensors = sensors
+        self.table = site_table(tuple(sensor.site for sensor in sensors))
+        self._serial = None
+        self._arrivals = np.zeros(len(sensors))
+        self._remaining = np.zeros(len(sensors), dtype=np.int64)
+        self._unsub_tick = None
+
+    @callback
+    def async_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if not self.coordinator.last_update_success or not self.coordinator.data:
+            return
+
+        eew = _latest_eew(self.coordinator, self.table)
+        eq: dict = eew.get("eq") or {}
+
+        # Skip the listener callbacks of the same serial
+        serial = (eew.get("id"), eew.get("serial"))
+        if serial == self._serial:
+            return
+
+        self._serial = serial
+        if None in (eq.get("lat"), eq.get("lon"), eq.get("time")):
+            self._arrivals = np.zeros(len(self.sensors))
+            for sensor in self.sensors:
+                sensor.async_set_arrival(eew.get("id"))
+        else:
+            p_arrivals = arrival_times(eq, self.table, "P")
+            s_arrivals = arrival_times(eq, self.table, "S")
+            counties = dict(zip(COUNTY_TABLE.keys, arrival_times(eq, COUNTY_TABLE, "S").round().astype(int).tolist()))
+            for index, sensor in enumerate(self.sensors):
+                sensor.async_set_arrival(eew.get("id"), p_arrivals[index], s_arrivals[index], counties)
+            self._arrivals = s_arrivals / 1000
+
+        # Write every sensor once with the arrivals of the new serial
+        self._remaining = np.full(len(self.sensors), -1)
+        self._async_tick()
+        if self._remaining.any() and self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(self.hass, self._async_tick, COUNTDOWN_INTERVAL)
+
+    @callback
+    def _async_tick(self, now: datetime | None = None) -> None:
+        """Update the remaining seconds and write the sensors which changed."""
+        remaining = np.ceil(self._arrivals - time.time()).clip(0).astype(np.int64)
+        for index in np.flatnonzero(remaining != self._remaining).tolist():
+            self.sensors[index].async_set_remaining(int(remaining[index]))
+
+        self._remaining = remaining
+        if not remaining.any():
+            self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop ticking."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+
+class SiteEstimator:
+    """Estimate the intensity of the configured sites on each earthquake serial.
+
+    Every site is computed in one vectorized call through the shared
+    estimate cache, only the sensors whose rounded intensity changed are
+    written to the state machine.
+    """
+
+    def __init__(self, config_entry: Trem2ConfigEntry, sensors: list[SiteIntensitySensor]) -> None:
+        """Initialize the estimator."""
+        self.coordinator = config_entry.runtime_data.coordinator
+        self.sensors = sensors
+        self.table = site_table(tuple(sensor.site for sensor in sensors))
+        self.model = config_entry.options.get(CONF_GROUND_MOTION_MODEL, DEFAULT_GROUND_MOTION_MODEL)
+        self._serial = None
+        self._scales = np.zeros(len(sensors), dtype=np.int8)
+
+    @callback
+    def async_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if not self.coordinator.last_update_success or not self.coordinator.data:
+            return
+
+        eew = _latest_eew(self.coordinator, self.table)
+        eq: dict = eew.get("eq") or {}
+
+        # Skip the listener callbacks of the same serial
+        serial = (eew.get("id"), eew.get("serial"))
+        if serial == self._serial:
+            return
+
+        self._serial = serial
+        if None in (eq.get("lat"), eq.get("lon"), eq.get("mag")):
+            scales = np.zeros_like(self._scales)
+        else:
+            scales = round_intensitys(estimate_event(eq, self.table, self.model))
+
+        for index in np.flatnonzero(scales != self._scales).tolist():
+            self.sensors[index].async_set_scale(int(scales[index]), eew.get("id"))
+
+        self._scales = scales
+
+
+class SiteIntensitySensor(SensorEntity):
+    """Defines a sensor of the estimated intensity at a configured site."""
+
+    def __init__(
+        self,
+        config_entry: Trem2ConfigEntry,
+        site: tuple[str, float, float, float | None],
+    ) -> None:
+        """Initialize the sensor, `site` is `(name, lat, lon, site_effect)`."""
+        self._attr_device_info = DeviceInfo(
+            identifiers={(config_entry.domain, config_entry.entry_id)},
+            name=config_entry.options.get(CONF_EMAIL, config_entry.title),
+            manufacturer=MANUFACTURER,
+            model="ExpTechTW TREM",
+            sw_version=__version__,
+        )
+        self._attr_icon = DEFAULT_ICON
+        self.config_entry = config_entry
+        self.site = site
+
+        self._state = 0
+        self._serial = None
+
+    @callback
+    def async_set_scale(self, scale: int, serial) -> None:
+        """Update the rounded intensity, it is written to the state machine once added."""
+        self._state = scale
+        self._serial = serial
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{DOMAIN.upper()} {self.site[0]}"
+
+    @property
+    def unique_id(self):
+        """Return the unique id of the sensor."""
+        return f"{DOMAIN}_{self.config_entry.entry_id.lower()}_site_{slugify(self.site[0])}"
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        name, lat, lon, site_effect = self.site
+
+        return {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            ATTR_ID: self._serial,
+            ATTR_LATITUDE: lat,
+            ATTR_LONGITUDE: lon,
+            ATTR_SITE_EFFECT: site_effect,
+            ATTR_INTENSITY: intensity_to_text(self._state),
+        }
+
+
 class NotificationSensor(SensorEntity):
     """Defines a earthquake sensor entity."""
 
@@ -187,6 +426,7 @@ class NotificationSensor(SensorEntity):
             self._attr_value[ATTR_DEPTH] = eq.get("depth", "")
             self._attr_value[ATTR_TIME] = time_of_occurrence.strftime("%Y/%m/%d %H:%M:%S")
             self._attr_value[ATTR_LIST] = eew.get("list")
+            self._attr_value[ATTR_ESTIMATED_LIST] = eew.get("estimated_list")
 
             self._state = eew["id"]
         except TypeError as ex:
@@ -281,3 +521,76 @@ class DiagnosticsSensor(SensorEntity):
     @property
     def _web_socket(self):
         return self.coordinator.web_socket
+
+
+class CountdownSensor(SensorEntity):
+    """Defines a sensor of the seconds until the S wave arrives at a site."""
+
+    def __init__(
+        self,
+        config_entry: Trem2ConfigEntry,
+        site: tuple[str, float, float, float | None],
+        counties: bool = False,
+    ) -> None:
+        """Initialize the sensor, `counties` adds the S wave arrival of every county."""
+        self._attr_device_info = DeviceInfo(
+            identifiers={(config_entry.domain, config_entry.entry_id)},
+            name=config_entry.options.get(CONF_EMAIL, config_entry.title),
+            manufacturer=MANUFACTURER,
+            model="ExpTechTW TREM",
+            sw_version=__version__,
+        )
+        self._attr_icon = COUNTDOWN_ICON
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self.config_entry = config_entry
+        self.site = site
+        self.counties = counties
+
+        self._state = 0
+        self._attr_value: dict[str, Any] = {}
+
+    @callback
+    def async_set_arrival(self, serial, p_arrival=None, s_arrival=None, counties: dict | None = None) -> None:
+        """Set the arrival timestamps in ms of a serial, they are written with the next remaining seconds."""
+        self._attr_value = {
+            ATTR_ID: serial,
+            ATTR_P_ARRIVAL: _format_timestamp(p_arrival),
+            ATTR_S_ARRIVAL: _format_timestamp(s_arrival),
+        }
+        if self.counties:
+            self._attr_value[ATTR_COUNTY_ARRIVAL] = counties or {}
+
+    @callback
+    def async_set_remaining(self, remaining: int) -> None:
+        """Update the remaining seconds, it is written to the state machine once added."""
+        self._state = remaining
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{DOMAIN.upper()} {self.site[0]} Countdown"
+
+    @property
+    def unique_id(self):
+        """Return the unique id of the sensor."""
+        return f"{DOMAIN}_{self.config_entry.entry_id.lower()}_countdown_{slugify(self.site[0])}"
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return {ATTR_ATTRIBUTION: ATTRIBUTION, **self._attr_value}
+
+
+def _format_timestamp(timestamp) -> str | None:
+    """Format a timestamp in ms like the time of occurrence."""
+    if timestamp is None:
+        return None
+
+    return datetime.fromtimestamp(timestamp / 1000, TZ_UTC).astimezone(TZ_TW).strftime("%Y/%m/%d %H:%M:%S")
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID, CONF_SERVICE_DATA, CONF_URL, EntityCategory
-from homeassistant.core import EventOrigin, HomeAssistant, ServiceCall
+from homeassistant.const import ATTR_ENTITY_ID, CONF_FILENAME, CONF_SERVICE_DATA, CONF_URL, EntityCategory
+from homeassistant.core import EventOrigin, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 
-from .const import ATTR_API_NODE, BASE_INTERVAL, DOMAIN, FAST_INTERVAL
+from .const import (
+    ATTR_API_NODE,
+    ATTR_EVENTS,
+    ATTR_LEVEL,
+    BASE_INTERVAL,
+    CONF_GROUND_MOTION_MODEL,
+    DEFAULT_GROUND_MOTION_MODEL,
+    DOMAIN,
+    ESTIMATE_LEVELS,
+    FAST_INTERVAL,
+)
+from .core.earthquake import estimate_batch
+from .core.geo import COUNTY_TABLE, TOWN_TABLE
+from .core.gmm import GROUND_MOTION_MODELS
 
 if TYPE_CHECKING:
     from .runtime import Trem2RuntimeData
@@ -103,6 +118,12 @@ async def async_register_services(hass: HomeAssistant) -> bool:
             "simulator",
             async_handle_simulate_earthquake,
         )
+        hass.services.async_register(
+            DOMAIN,
+            "estimate_batch",
+            async_handle_estimate_batch,
+            supports_response=SupportsResponse.ONLY,
+        )
         hass.services.async_register(
             DOMAIN,
             "set_http_node",
@@ -113,3 +134,92 @@ async def async_register_services(hass: HomeAssistant) -> bool:
         raise HomeAssistantError(f"Failed to register services: {e}") from e
 
     return True
+
+
+async def async_handle_estimate_batch(call: ServiceCall) -> ServiceResponse:
+    """Estimate the intensity of hypothetical earthquakes, the live data is not touched."""
+    hass = call.hass
+    events = call.data.get(ATTR_EVENTS)
+    filename = call.data.get(CONF_FILENAME)
+    level, model = _estimate_options(call)
+
+    if filename:
+        filepath = _config_file(hass, filename)
+        try:
+            events = await hass.async_add_executor_job(filepath.read_text, "utf-8")
+        except OSError as e:
+            raise HomeAssistantError(f"Failed to read `{filename}`: {e}") from e
+
+    if not events:
+        raise ServiceValidationError("Missing `Events` or `Filename`")
+
+    return await hass.async_add_executor_job(_estimate_events, events, level, model)
+
+
+def _estimate_options(call: ServiceCall) -> tuple[str, str]:
+    """Return the level and the model of the estimate, raise if either is unknown."""
+    level = call.data.get(ATTR_LEVEL) or ESTIMATE_LEVELS[0]
+    model = call.data.get(CONF_GROUND_MOTION_MODEL) or DEFAULT_GROUND_MOTION_MODEL
+
+    if level not in ESTIMATE_LEVELS:
+        raise ServiceValidationError(f"Unknown level `{level}`, expected one of {ESTIMATE_LEVELS}")
+
+    if model not in GROUND_MOTION_MODELS:
+        raise ServiceValidationError(f"Unknown model `{model}`, expected one of {list(GROUND_MOTION_MODELS)}")
+
+    return level, model
+
+
+def _config_file(hass: HomeAssistant, filename: str) -> Path:
+    """Return the path of a file in the config folder, raise if it points outside of it."""
+    config_dir = Path(hass.config.config_dir).resolve()
+    filepath = Path(hass.config.path(filename)).resolve()
+    if not filepath.is_relative_to(config_dir):
+        raise ServiceValidationError(f"Cannot read `{filename}`, the file must be in the config folder")
+
+    return filepath
+
+
+def _estimate_events(events: str | dict | list, level: str, model: str) -> ServiceResponse:
+    """Parse the scenario events and estimate their intensity, this blocks and belongs in a worker thread.
+
+    The events are a list, or a JSON document of a list or of an object
+    with an `events` list. Each event is either the earthquake data or an
+    object holding it in `eq`, the same format as the simulator.
+    """
+    try:
+        if isinstance(events, str):
+            events = json.loads(events)
+    except ValueError as e:
+        raise ServiceValidationError(f"Events are not valid JSON: {e}") from e
+
+    if isinstance(events, dict):
+        events = events.get(ATTR_EVENTS, [events])
+    if not isinstance(events, list):
+        raise ServiceValidationError("Events must be a list")
+
+    eqs = []
+    for index, event in enumerate(events):
+        eq = event.get("eq", event) if isinstance(event, dict) else None
+        try:
+            eqs.append({key: float(eq[key]) for key in ("lat", "lon", "mag")} | {"depth": float(eq.get("depth") or 0)})
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ServiceValidationError(f"Event {index} needs a numeric `lat`, `lon` and `mag`") from e
+
+    table = TOWN_TABLE if level == "town" else COUNTY_TABLE
+    results = [
+        {
+            "id": event.get("id", index),
+            "eq": eq,
+            "max": max(scales.values(), default=0),
+            "intensity": {str(key): scale for key, scale in scales.items()},
+        }
+        for index, (event, eq, scales) in enumerate(zip(events, eqs, estimate_batch(eqs, table, model), strict=True))
+    ]
+
+    return {
+        ATTR_LEVEL: level,
+        CONF_GROUND_MOTION_MODEL: model,
+        "count": len(results),
+        "results": results,
+    }
@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
 import logging
+import os
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
-from .const import DEFINED_STORES, DOMAIN
+from .const import CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY, DEFINED_STORES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class StoreHandler:
-    """Manages the lifecycle of all storage instances for a config entry."""
+    """Manages the lifecycle of all storage instances for a config entry.
+
+    The stores are read once at setup. Changes only mark a store dirty and
+    schedule a delayed write, so a burst of messages is written once at
+    the end of the save window instead of once per message. Dirty stores
+    are flushed on shutdown and unload.
+    """
 
     def __init__(
         self,
@@ -23,6 +35,13 @@ class StoreHandler:
         self._hass = hass
         self._config_entry = config_entry
         self.stores: dict[str, Store] = {}
+        self.data: dict[str, Any] = {}
+        self.save_delay: int = config_entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+        self.writes: dict[str, int] = {}
+        self.bytes_written: dict[str, int] = {}
+        self._dirty: set[str] = set()
+        self._unsub_save: dict[str, CALLBACK_TYPE] = {}
+        self._extras: dict[str, dict[str, Callable[[], Any]]] = {}
 
     def setup_stores(self):
         """Create all defined Store instances based on the central configuration."""
@@ -35,6 +54,85 @@ class StoreHandler:
             self.stores[name] = store
             _LOGGER.debug("Initialized store '%s' with key: %s", name, key)
 
+    async def async_load_stores(self) -> None:
+        """Hydrate the in-memory data of every store, this is the only time they are read from disk."""
+        for name, store in self.stores.items():
+            self.data[name] = await store.async_load()
+            _LOGGER.debug("Loaded store '%s'", name)
+
     def get_store(self, name: str) -> Store:
         """Get a specific store instance by its friendly name."""
         return self.stores[name]
+
+    def get_data(self, name: str) -> Any:
+        """Get the data of a store as loaded at setup, None if it was empty."""
+        return self.data.get(name)
+
+    def register_extra(self, name: str, key: str, data_func: Callable[[], Any]) -> None:
+        """Save the result of `data_func` under `key` along with the data of a store."""
+        self._extras.setdefault(name, {})[key] = data_func
+
+    @callback
+    def async_delay_save(self, name: str) -> None:
+        """Mark a store dirty and write it once the save window has passed."""
+        self._dirty.add(name)
+        if name in self._unsub_save:
+            return
+
+        async def _async_save_later(_now: datetime) -> None:
+            self._unsub_save.pop(name, None)
+            await self._async_save(name)
+
+        self._unsub_save[name] = async_call_later(self._hass, self.save_delay, _async_save_later)
+
+    async def async_flush(self) -> None:
+        """Write the dirty stores now."""
+        for name in list(self._dirty):
+            await self._async_save(name)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the write count, the bytes written and the dirty flag of every store."""
+        return {
+            name: {
+                "writes": self.writes.get(name, 0),
+                "bytes": self.bytes_written.get(name, 0),
+                "dirty": name in self._dirty,
+            }
+            for name in self.stores
+        }
+
+    async def _async_save(self, name: str) -> None:
+        """Write a store, then count the write and add the size of its file to the bytes written.
+
+        The store stays dirty if the write fails, or if it changed again while
+        being written, so the next save or flush still writes it.
+        """
+        if unsub := self._unsub_save.pop(name, None):
+            unsub()
+
+        store = self.stores[name]
+        await store.async_save(self._data_to_save(name))
+
+        try:
+            size = await self._hass.async_add_executor_job(os.path.getsize, store.path)
+        except OSError as e:
+            _LOGGER.warning("Store '%s' was not written: %s", name, e)
+            return
+
+        if name not in self._unsub_save:
+            self._dirty.discard(name)
+        self.writes[name] = self.writes.get(name, 0) + 1
+        self.bytes_written[name] = self.bytes_written.get(name, 0) + size
+
+    @callback
+    def _data_to_save(self, name: str) -> Any:
+        """Return a snapshot of the data of a store when it is written.
+
+        This runs on the event loop, the Store serializes the snapshot itself.
+        """
+        data = self._config_entry.runtime_data.coordinator.data[name]
+        data = {key: list(value) if isinstance(value, deque) else value for key, value in data.items()}
+        if extras := self._extras.get(name):
+            data.update({key: data_func() for key, data_func in extras.items()})
+
+        return data
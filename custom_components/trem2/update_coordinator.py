@@ -63,14 +63,7 @@ class Trem2UpdateCoordinator(DataUpdateCoordinator):
         if self.web_socket and self.web_socket.state.is_running:
             await self.web_socket.disconnect()
 
-        renect_store = runtime_data.sotre_handler.get_store("recent")
-        await renect_store.async_save(
-            self.data["recent"],
-        )
-        report_store = runtime_data.sotre_handler.get_store("report")
-        await report_store.async_save(
-            self.data["report"],
-        )
+        await runtime_data.sotre_handler.async_flush()
 
     async def _async_update_data(self):
         """Perform update data."""
@@ -119,9 +112,7 @@ class Trem2UpdateCoordinator(DataUpdateCoordinator):
             return
 
         report_data = await self.http_client.fetch_report(limit=1)
-        cache: list[dict[str, Any]] = self.data["recent"]["cache"]
-        seen = {d["id"] for d in cache}
-        if report_data[0]["id"] in seen:
+        if report_data[0]["id"] in self.data_client.eew_ids:
             await self.data_client.fetch_report()
             self.config_entry.runtime_data.fetch_report = False
 
@@ -230,6 +221,7 @@ class Trem2UpdateCoordinator(DataUpdateCoordinator):
                 coordinator_data = self.data
                 resp.pop("type", None)
                 coordinator_data["recent"]["intensity"] = resp
+                self.config_entry.runtime_data.sotre_handler.async_delay_save("recent")
                 _LOGGER.debug("Intensity data: %s", resp)
                 setattr(self.config_entry.runtime_data, "selected_option", None)
                 self.async_set_updated_data(coordinator_data)
@@ -239,6 +231,7 @@ class Trem2UpdateCoordinator(DataUpdateCoordinator):
                 tsunami_data: dict = resp.get("data", {})
                 tsunami_data.setdefault("time", resp.get("time", 0))
                 coordinator_data["recent"]["tsunami"] = tsunami_data
+                self.config_entry.runtime_data.sotre_handler.async_delay_save("recent")
                 _LOGGER.debug("Tsunami Data: %s", tsunami_data)
                 self.async_set_updated_data(coordinator_data)
 
@@ -0,0 +1,65 @@
+"""ZIP3 code lookup tables for TREM2 component."""
+
+from __future__ import annotations
+
+import sys
+
+from .const import ATTR_COUNTY, COUNTY_TOWN, ZIP3_TOWN
+
+ZIP3_SLOTS = 1000
+
+
+def _zip3_county() -> tuple[str | None, ...]:
+    """Map every ZIP3 code to its county id.
+
+    A township belongs to the county its name starts with, which also
+    settles the overlapping ranges of `COUNTY_TOWN`. Codes without a
+    township name fall back to the first range which holds them.
+    """
+    slots: list[str | None] = [None] * ZIP3_SLOTS
+    for county_id, (zip_start, zip_end) in reversed(COUNTY_TOWN.items()):
+        slots[zip_start:zip_end + 1] = [county_id] * (zip_end - zip_start + 1)
+
+    for zip3, town in ZIP3_TOWN.items():
+        slots[zip3] = next(
+            (county_id for county_id, county in ATTR_COUNTY.items() if town.startswith(county)),
+            slots[zip3],
+        )
+
+    return tuple(slots)
+
+
+def _zip3_town() -> tuple[str | None, ...]:
+    """Map every ZIP3 code to its interned township name."""
+    slots: list[str | None] = [None] * ZIP3_SLOTS
+    for zip3, town in ZIP3_TOWN.items():
+        slots[zip3] = sys.intern(town)
+
+    return tuple(slots)
+
+
+ZIP3_COUNTY = _zip3_county()
+ZIP3_TOWN_NAME = _zip3_town()
+
+
+def zip3_to_county(area: dict) -> dict[str, int]:
+    """Return the highest intensity of every county in the area, the ZIP3 codes grouped by intensity."""
+    result: dict[str, int] = {}
+    for intensity, codes in area.items():
+        scale = int(intensity)
+        for code in codes:
+            county_id = ZIP3_COUNTY[code] if 0 <= code < ZIP3_SLOTS else None
+            if county_id is not None and result.get(county_id, -1) < scale:
+                result[county_id] = scale
+
+    return result
+
+
+def zip3_to_town(area: dict) -> dict[int, list[str]]:
+    """Return the township names of every intensity in the area, in reverse order of the codes."""
+    return {
+        int(intensity): [
+            ZIP3_TOWN_NAME[code] for code in reversed(codes) if 0 <= code < ZIP3_SLOTS and ZIP3_TOWN_NAME[code]
+        ]
+        for intensity, codes in area.items()
+    }